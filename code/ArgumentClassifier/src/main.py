@@ -1,9 +1,9 @@
 # -*- coding: utf-8 -*-
 """
     Created by: Andrés Segura-Tinoco
-    Version: 1.4.1
+    Version: 1.17.0
     Created on: Aug 27, 2021
-    Updated on: Apr 06, 2023
+    Updated on: Oct 18, 2026
     Description: Main class of the argument classifier.
 """
 
@@ -11,11 +11,17 @@
 from util import files as ufl
 import ml.engine as mle
 import ml.logging as mll
-from ml.constant import TaskType
+from ml.constant import TaskType, FeatureBlock, FinalModel, RunMode
+from ml.dataset import SparseDataset
 
 # Import Python base libraries
+import os
 import time
 import json
+import shutil
+import tempfile
+import itertools
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 import gc
 
@@ -37,6 +43,10 @@ def get_curr_dataset_name(feat_setup:dict) -> str:
         if type(v) is bool:
             ds_name += str(int(v))
     
+    # Hashed feature space
+    if feat_setup.get("hash_bits"):
+        ds_name += "_h" + str(feat_setup["hash_bits"])
+    
     return ds_name
 
 # Return the target label from the current task
@@ -78,74 +88,425 @@ def save_results(result_folder:str, data:list, ml_ngx:mle.MLEngine) -> int:
         model_id = 0
     return model_id
 
+# Return the result index of the evaluated scenarios (scenario key -> model id), entries without a metrics row are dropped
+def read_result_index(result_folder:str) -> dict:
+    index = {}
+    filepath = result_folder + "metrics_index.json"
+    
+    if os.path.exists(filepath):
+        df = ufl.get_df_from_csv(result_folder + "metrics.csv")
+        model_ids = set(df["id"].tolist()) if df is not None else set()
+        index = {k: v for k, v in ufl.get_dict_from_json(filepath).items() if v in model_ids}
+    
+    return index
+
+# Return the content hash of a task scenario (ablation scenarios do not save a final model, so they have their own keys)
+def get_scenario_key(logger:mll.MLLog, app_setup:dict, task:str, run_mode:str=RunMode.APP.value) -> str:
+    ml_ngx = mle.MLEngine(language=app_setup["language"], task_type=task, logger=logger)
+    return ml_ngx.get_scenario_key(app_setup["data_folder"], app_setup["features"], app_setup["pipeline"], app_setup["train"], run_mode)
+
+# Return True if a task scenario is already in the result index and force_run is not set (the skip is logged)
+def is_evaluated_scenario(logger:mll.MLLog, app_setup:dict, task:str, result_index:dict, run_mode:str=RunMode.APP.value) -> bool:
+    key = get_scenario_key(logger, app_setup, task, run_mode)
+    model_id = result_index.get(key, 0) if not app_setup["force_run"] else 0
+    
+    if model_id > 0:
+        logger.log_info("- %s: scenario %s already evaluated (model id %s), skipped" % (task.title(), key, model_id))
+    
+    return model_id > 0
+
+# Save the model id of an evaluated task scenario in the result index
+def save_result_key(logger:mll.MLLog, app_setup:dict, task:str, model_id:int, run_mode:str=RunMode.APP.value) -> bool:
+    filepath = app_setup["result_folder"] + "metrics_index.json"
+    index = ufl.get_dict_from_json(filepath) if os.path.exists(filepath) else {}
+    index[get_scenario_key(logger, app_setup, task, run_mode)] = int(model_id)
+    return ufl.save_dict_to_json(filepath, index)
+
 # Create a valid and descriptive model file path
 def create_model_filename(folder_path:str, model_id:str, am_task:str, ml_algo:str, sep:str="-") -> str:
     model_ext = "joblib"
     file_path = folder_path + "model-" + str(model_id) + sep + am_task.replace(" ", sep) + sep + ml_algo.replace(" ", sep) + "." + model_ext
     return file_path
 
+# Split, train and test a scenario (returns the metrics row and the trained model)
+def evaluate_scenario(ml_ngx:mle.MLEngine, task:str, dataset, model_classes:list, feat_setup:dict, pipeline_setup:dict, train_setup:dict, start_time:float) -> tuple:
+    model_state = train_setup["model_state"]
+    
+    # 3. Split dataset
+    X_train, X_test, y_train, y_test = ml_ngx.split_dataset(dataset, train_setup)
+    
+    # 4. Create or fit model pipeline
+    if train_setup["hp_tuning"]:
+        clf, params = ml_ngx.create_and_fit_model(pipeline_setup, X_train, y_train, model_classes, model_state, train_setup)
+    else:
+        clf, params = ml_ngx.create_and_train_model(pipeline_setup, X_train, y_train, model_classes, model_state, train_setup)
+    
+    # 5. Test model
+    metrics_test = ml_ngx.test_model(clf, X_test, y_test, model_classes)
+    elapsed_time = (time.time() - start_time)
+    
+    # 6. Error analysis
+    error_ids = ml_ngx.get_mislabeled_records()
+    save_error_ids(error_ids, X_test)
+    
+    # 7. Model params and results (with the hyperparameter search summary)
+    dataset_name = get_curr_dataset_name(feat_setup)
+    search_info = ml_ngx.get_search_info() if train_setup["hp_tuning"] else {"strategy": "none"}
+    results = save_metrics(task, dataset_name, "test", {**pipeline_setup, "hp_search": search_info}, params, metrics_test, elapsed_time)
+    
+    return results, clf
+
+# Train, test and save the results of a scenario (returns the model id)
+def run_scenario(ml_ngx:mle.MLEngine, task:str, dataset, model_classes:list, feat_setup:dict, pipeline_setup:dict, train_setup:dict, result_folder:str, start_time:float) -> int:
+    
+    # 3-6. Split dataset, train and test model
+    results, clf = evaluate_scenario(ml_ngx, task, dataset, model_classes, feat_setup, pipeline_setup, train_setup, start_time)
+    
+    # 7. Save model params and results
+    model_id = save_results(result_folder, results, ml_ngx)
+    
+    return model_id
+
+# Run the scenario of a task: read its dataset, evaluate it and create its final model (nothing is saved)
+def run_task_scenario(logger:mll.MLLog, app_setup:dict, task:str, shared_data:tuple, n_workers:int=1) -> dict:
+    start_time = time.time()
+    logger.log_info("\n>> Scenario begins")
+    
+    # 0. Program variables
+    feat_setup = app_setup["features"]
+    pipeline_setup = app_setup["pipeline"]
+    train_setup = app_setup["train"]
+    create_dataset = app_setup["create_dataset"]
+    data_folder = app_setup["data_folder"]
+    language = app_setup["language"]
+    sparse_dataset = app_setup["sparse_dataset"]
+    stem_setup = app_setup["stem_cache"]
+    parallel_setup = {**app_setup["parallel"], "scenario_workers": n_workers}
+    dr_algo = pipeline_setup["dim_red_algo"]
+    ml_algo = pipeline_setup["ml_algo"]
+    model_state = train_setup["model_state"]
+    y_label = get_target_label(task)
+    logger.log_info("- %s (%s - %s):" % (task.title(), ml_algo, dr_algo))
+    
+    # 1. Machine Learning engine object
+    ml_ngx = mle.MLEngine(language=language, task_type=task, logger=logger, stem_setup=stem_setup, parallel_setup=parallel_setup)
+    
+    # 2. Read dataset
+    dataset, label_dict = ml_ngx.create_dataset(data_folder, y_label, create_dataset, feat_setup, sparse_dataset, shared_data)
+    model_classes = [*label_dict.values()]
+    
+    # 3-7. Split dataset, train and test model
+    results, clf = evaluate_scenario(ml_ngx, task, dataset, model_classes, feat_setup, pipeline_setup, train_setup, start_time)
+    
+    # 8. Create final model (refit, reuse or warm-start the trained model)
+    clf = ml_ngx.create_final_model(dataset, pipeline_setup, model_classes, model_state, train_setup, clf) if len(results) else None
+    
+    logger.log_info(">> Scenario ends")
+    return {"task": task, "results": results, "model": clf, "featurizer": ml_ngx.featurizer, "model_classes": model_classes, "sparse_dataset": sparse_dataset, "start_time": start_time}
+
+# Run the streaming scenario of a task: the models are trained with partial_fit over chunks of feature records (constant memory)
+def run_stream_scenario(logger:mll.MLLog, app_setup:dict, task:str) -> dict:
+    start_time = time.time()
+    logger.log_info("\n>> Streaming scenario begins")
+    
+    # 0. Program variables
+    feat_setup = app_setup["features"]
+    pipeline_setup = app_setup["pipeline"]
+    train_setup = app_setup["train"]
+    stream_setup = train_setup["streaming"]
+    final_mode = train_setup["final_model"]["mode"]
+    model_state = train_setup["model_state"]
+    y_label = get_target_label(task)
+    logger.log_info("- %s (%s - streaming):" % (task.title(), pipeline_setup["ml_algo"]))
+    
+    # 1. Machine Learning engine object
+    ml_ngx = mle.MLEngine(language=app_setup["language"], task_type=task, logger=logger, stem_setup=app_setup["stem_cache"])
+    
+    # 2. Read streaming dataset (featurizer, labels and train/test rows)
+    stream_data, label_dict = ml_ngx.create_stream_dataset(app_setup["data_folder"], y_label, feat_setup, train_setup)
+    model_classes = [*label_dict.values()]
+    
+    # 3-4. Train model with the train rows
+    clf, params = ml_ngx.create_and_train_stream_model(pipeline_setup, stream_data, stream_data["train_rows"], model_classes, model_state, stream_setup)
+    results = []
+    
+    if clf is not None:
+        
+        # 5. Test model
+        metrics_test = ml_ngx.test_stream_model(clf, stream_data, model_classes, stream_setup)
+        elapsed_time = (time.time() - start_time)
+        
+        # 6. Error analysis
+        save_error_ids(ml_ngx.get_mislabeled_records(), None)
+        
+        # 7. Model params and results
+        results = save_metrics(task, get_curr_dataset_name(feat_setup), "test", {**pipeline_setup, "streaming": stream_setup}, params, metrics_test, elapsed_time)
+        
+        # 8. Create final model (refit with all the rows, reuse, or continue training with the test rows)
+        if final_mode == FinalModel.WARM_START.value:
+            clf, params = ml_ngx.create_and_train_stream_model(pipeline_setup, stream_data, stream_data["test_rows"], model_classes, model_state, stream_setup, clf)
+        elif final_mode == FinalModel.REFIT.value:
+            clf, params = ml_ngx.create_and_train_stream_model(pipeline_setup, stream_data, stream_data["rows"], model_classes, model_state, stream_setup)
+    
+    logger.log_info(">> Streaming scenario ends")
+    return {"task": task, "results": results, "model": clf, "featurizer": ml_ngx.featurizer, "model_classes": model_classes, "sparse_dataset": True, "start_time": start_time}
+
+# Run the scenario of a task in a worker process (the shared feature matrix is memory-mapped read-only)
+def run_task_worker(app_setup:dict, task:str, shared_folder:str, labels:list, verbose:bool, n_workers:int) -> dict:
+    logger = mll.MLLog(verbose=verbose)
+    shared_data = (SparseDataset.load_arrays(shared_folder), labels)
+    return run_task_scenario(logger, app_setup, task, shared_data, n_workers)
+
+# Log the error of a failed task scenario with its setup
+def log_scenario_error(logger:mll.MLLog, app_setup:dict, task:str, error:Exception):
+    setup = {"features": get_curr_dataset_name(app_setup["features"]), "pipeline": app_setup["pipeline"], "model_state": app_setup["train"]["model_state"]}
+    logger.log_error(">> ERROR - The %s scenario failed: %s, setup: %s" % (task, repr(error), json.dumps(setup)))
+
+# Run the scenario of a task in the current process (a failed scenario is logged and returns None, the next ones keep running)
+def try_task_scenario(logger:mll.MLLog, app_setup:dict, task:str, shared_data:tuple) -> dict:
+    scenario = None
+    
+    try:
+        scenario = run_task_scenario(logger, app_setup, task, shared_data)
+    except Exception as e:
+        log_scenario_error(logger, app_setup, task, e)
+    
+    return scenario
+
+# Run the task scenarios on a process pool (results are returned in task order, None for the failed ones), setups are the app setups of each task (default: app_setup)
+def run_parallel_scenarios(logger:mll.MLLog, app_setup:dict, tasks:list, shared_data:tuple, n_workers:int, setups:list=None) -> list:
+    shared_dataset, labels = shared_data
+    setups = setups if setups is not None else [app_setup] * len(tasks)
+    
+    # The shared feature matrix is written once as .npy arrays instead of being pickled to each worker
+    shared_folder = tempfile.mkdtemp(prefix="shared-", dir=app_setup["data_folder"] + "cache/") + "/"
+    shared_dataset.save_arrays(shared_folder)
+    logger.log_info("- Running %s task scenarios on %s worker processes" % (len(tasks), n_workers))
+    
+    try:
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            futures = [pool.submit(run_task_worker, setup, task, shared_folder, labels, logger.verbose, n_workers) for setup, task in zip(setups, tasks)]
+            
+            # A failed scenario is logged, the completed ones are kept
+            scenarios = []
+            for setup, task, future in zip(setups, tasks, futures):
+                try:
+                    scenarios.append(future.result())
+                except Exception as e:
+                    log_scenario_error(logger, setup, task, e)
+                    scenarios.append(None)
+    finally:
+        shutil.rmtree(shared_folder, ignore_errors=True)
+    
+    return scenarios
+
+# Expand the sweep axes into (app setup, task) scenarios, nested as features > task > seed > scaler > reducer > algorithm,
+# so the scenarios sharing a dataset, a train split and a preprocessing prefix run back-to-back (missing axes keep the app setup value)
+def expand_sweep(app_setup:dict, sweep:dict) -> list:
+    pipeline_setup = app_setup["pipeline"]
+    axes = [[{**app_setup["features"], **feat_setup} for feat_setup in sweep.get("features", [{}])],
+            sweep.get("tasks", app_setup["tasks"]),
+            sweep.get("seeds", [app_setup["train"]["model_state"]]),
+            sweep.get("scalers", [pipeline_setup["data_scale_algo"]]),
+            sweep.get("reducers", [pipeline_setup["dim_red_algo"]]),
+            sweep.get("algorithms", [pipeline_setup["ml_algo"]])]
+    scenarios = []
+    
+    for feat_setup, task, seed, scaler, reducer, ml_algo in itertools.product(*axes):
+        setup = {**app_setup, "features": feat_setup, "tasks": [task],
+                 "pipeline": {**pipeline_setup, "data_scale_algo": scaler, "dim_red_algo": reducer, "ml_algo": ml_algo},
+                 "train": {**app_setup["train"], "model_state": seed}}
+        scenarios.append((setup, task))
+    
+    return scenarios
+
+# Return the number of scenario worker processes: dense datasets run sequentially, since each worker would convert the shared
+# memory-mapped CSR matrix to its own private dense copy (sparse_dataset: true is required to run scenarios in parallel)
+def get_scenario_workers(logger:mll.MLLog, app_setup:dict, n_scenarios:int) -> int:
+    n_workers = min(app_setup["parallel"]["scenario_workers"], n_scenarios)
+    
+    if n_workers > 1 and not app_setup["sparse_dataset"]:
+        logger.log_info("- Dense dataset (sparse_dataset: false): the %s scenarios run sequentially instead of on %s worker processes" % (n_scenarios, n_workers))
+        n_workers = 1
+    
+    return n_workers
+
+# Save the results and the final model of a task scenario (returns the model id)
+def save_task_scenario(logger:mll.MLLog, app_setup:dict, scenario:dict) -> int:
+    task = scenario["task"]
+    ml_ngx = mle.MLEngine(language=app_setup["language"], task_type=task, logger=logger)
+    ml_ngx.featurizer = scenario["featurizer"]
+    
+    # 7. Save model params and results (and index the scenario), a scenario without results (failed) is not saved
+    model_id = save_results(app_setup["result_folder"], scenario["results"], ml_ngx) if len(scenario["results"]) else 0
+    if model_id > 0:
+        save_result_key(logger, app_setup, task, model_id)
+    
+    # 8. Save final model
+    if model_id > 0 and scenario["model"] is not None:
+        filepath = create_model_filename(app_setup["model_folder"], model_id, task, app_setup["pipeline"]["ml_algo"])
+        ml_ngx.save_model(filepath, scenario["model"], scenario["sparse_dataset"], scenario["model_classes"])
+        
+        #  9. Use model (make predictions)
+        pass
+    
+    logger.log_info("- %s: model id %s, elapsed time: %s seconds" % (task.title(), model_id, time.time() - scenario["start_time"]))
+    return model_id
+
+# Return True if the pipeline setup is valid (its errors are logged)
+def check_pipeline_setup(logger:mll.MLLog, app_setup:dict, streaming:bool=False) -> bool:
+    ml_ngx = mle.MLEngine(language=app_setup["language"], task_type=app_setup["tasks"][0], logger=logger)
+    errors = ml_ngx.check_pipeline_setup(app_setup["pipeline"], app_setup["sparse_dataset"], streaming)
+    
+    for error in errors:
+        logger.log_error(">> ERROR - " + error)
+    
+    return len(errors) == 0
+
 # Start application
 def start_app(logger:mll.MLLog, app_setup:dict):
     tasks = app_setup["tasks"]
+    
+    if not check_pipeline_setup(logger, app_setup):
+        return
+    
+    # Already evaluated task scenarios are skipped (unless force_run is set)
+    result_index = read_result_index(app_setup["result_folder"])
+    tasks = [task for task in tasks if not is_evaluated_scenario(logger, app_setup, task, result_index)]
+    if not len(tasks):
+        return
+    n_workers = get_scenario_workers(logger, app_setup, len(tasks))
+    
+    # Shared feature dataset (created once, only the label vector and row mask change between tasks)
+    logger.log_info("\n>> Shared featurization")
+    ml_ngx = mle.MLEngine(language=app_setup["language"], task_type=tasks[0], logger=logger, stem_setup=app_setup["stem_cache"])
+    shared_data = ml_ngx.create_shared_dataset(app_setup["data_folder"], app_setup["create_dataset"], app_setup["features"])
+    
+    # Independent task scenarios run on worker processes, results are saved in task order
+    if n_workers > 1 and shared_data[0] is not None:
+        scenarios = run_parallel_scenarios(logger, app_setup, tasks, shared_data, n_workers)
+        for scenario in scenarios:
+            if scenario is not None:
+                save_task_scenario(logger, app_setup, scenario)
+    else:
+        for task in tasks:
+            scenario = run_task_scenario(logger, app_setup, task, shared_data)
+            save_task_scenario(logger, app_setup, scenario)
 
-    for task in tasks:
-        start_time = time.time()
-        logger.log_info("\n>> Scenario begins")
+# Start streaming application: no feature matrix is created, each task reads the feature records in chunks
+def start_stream_app(logger:mll.MLLog, app_setup:dict):
+    
+    if not check_pipeline_setup(logger, app_setup, streaming=True):
+        return
+    result_index = read_result_index(app_setup["result_folder"])
+    
+    for task in app_setup["tasks"]:
+        if is_evaluated_scenario(logger, app_setup, task, result_index):
+            continue
+        scenario = run_stream_scenario(logger, app_setup, task)
+        save_task_scenario(logger, app_setup, scenario)
+
+# Start experiment sweep: the scenarios of each feature setup share one feature dataset and run on a process pool
+def start_sweep(logger:mll.MLLog, app_setup:dict):
+    sweep = ufl.get_dict_from_json(app_setup["sweep"])
+    
+    if not len(sweep):
+        logger.log_error(">> ERROR - The sweep file could not be read: " + app_setup["sweep"])
+        return
+    
+    # Invalid step combinations and already evaluated (or repeated) scenarios are skipped
+    result_index = read_result_index(app_setup["result_folder"])
+    scenarios = {}
+    for setup, task in expand_sweep(app_setup, sweep):
+        if check_pipeline_setup(logger, setup) and not is_evaluated_scenario(logger, setup, task, result_index):
+            scenarios.setdefault(get_scenario_key(logger, setup, task), (setup, task))
+    scenarios = list(scenarios.values())
+    logger.log_info("\n>> Sweep begins: %s scenarios" % len(scenarios))
     
+    for _, group in itertools.groupby(scenarios, key=lambda scenario: json.dumps(scenario[0]["features"], sort_keys=True)):
+        setups, tasks = map(list, zip(*group))
+        n_workers = get_scenario_workers(logger, app_setup, len(tasks))
+        
+        # Shared feature dataset of the group
+        logger.log_info("\n>> Shared featurization: " + get_curr_dataset_name(setups[0]["features"]))
+        ml_ngx = mle.MLEngine(language=app_setup["language"], task_type=tasks[0], logger=logger, stem_setup=app_setup["stem_cache"])
+        shared_data = ml_ngx.create_shared_dataset(app_setup["data_folder"], app_setup["create_dataset"], setups[0]["features"])
+        
+        # Results are appended to the metrics file in scenario order (failed scenarios are logged and skipped)
+        if n_workers > 1 and shared_data[0] is not None:
+            group_scenarios = run_parallel_scenarios(logger, app_setup, tasks, shared_data, n_workers, setups)
+        else:
+            group_scenarios = (try_task_scenario(logger, setup, task, shared_data) for setup, task in zip(setups, tasks))
+        
+        for setup, scenario in zip(setups, group_scenarios):
+            if scenario is not None:
+                save_task_scenario(logger, setup, scenario)
+    
+    logger.log_info(">> Sweep ends")
+
+# Start feature ablation: feature-flag subsets are evaluated over one full feature matrix
+def start_ablation(logger:mll.MLLog, app_setup:dict):
+    tasks = app_setup["tasks"]
+    base_setup = app_setup["features"]
+    
+    if not check_pipeline_setup(logger, app_setup):
+        return
+    subsets = [{**base_setup, **subset} for subset in app_setup["ablation"]]
+    result_index = read_result_index(app_setup["result_folder"])
+    
+    for task in tasks:
+        logger.log_info("\n>> Ablation begins")
+        
+        # Already evaluated subsets are skipped (unless force_run is set)
+        task_subsets = [subset for subset in subsets if not is_evaluated_scenario(logger, {**app_setup, "features": subset}, task, result_index, RunMode.ABLATION.value)]
+        
         # 0. Program variables
-        feat_setup = app_setup["features"]
         pipeline_setup = app_setup["pipeline"]
         train_setup = app_setup["train"]
         create_dataset = app_setup["create_dataset"]
         data_folder = app_setup["data_folder"]
         language = app_setup["language"]
-        model_folder = app_setup["model_folder"]
         result_folder = app_setup["result_folder"]
-        dr_algo = pipeline_setup["dim_red_algo"]
-        ml_algo = pipeline_setup["ml_algo"]
-        model_state = train_setup["model_state"]
+        sparse_dataset = app_setup["sparse_dataset"]
+        stem_setup = app_setup["stem_cache"]
+        parallel_setup = {**app_setup["parallel"], "scenario_workers": 1}
         y_label = get_target_label(task)
-        logger.log_info("- %s (%s - %s):" % (task.title(), ml_algo, dr_algo))
+        logger.log_info("- %s (%s subsets):" % (task.title(), len(task_subsets)))
         
         # 1. Machine Learning engine object
-        ml_ngx = mle.MLEngine(language=language, task_type=task, logger=logger)
-        
-        # 2. Read dataset
-        dataset, label_dict = ml_ngx.create_dataset(data_folder, y_label, create_dataset, feat_setup)
-        model_classes = [*label_dict.values()]
-    
-        # 3. Split dataset
-        X_train, X_test, y_train, y_test = ml_ngx.split_dataset(dataset, train_setup)
-        
-        # 4. Create or fit model pipeline
-        if train_setup["hp_tuning"]:
-            clf, params = ml_ngx.create_and_fit_model(pipeline_setup, X_train, y_train, model_classes, model_state, train_setup)
-        else:
-            clf, params = ml_ngx.create_and_train_model(pipeline_setup, X_train, y_train, model_classes, model_state)
+        ml_ngx = mle.MLEngine(language=language, task_type=task, logger=logger, stem_setup=stem_setup, parallel_setup=parallel_setup)
         
-        # 5. Test model
-        metrics_test = ml_ngx.test_model(clf, X_test, y_test, model_classes)
-        elapsed_time = (time.time() - start_time)
-        
-        # 6. Error analysis
-        error_ids = ml_ngx.get_mislabeled_records()
-        save_error_ids(error_ids, X_test)
-        
-        # 7. Save model params and results
-        dataset_name = get_curr_dataset_name(feat_setup)
-        results = save_metrics(task, dataset_name, "test", pipeline_setup, params, metrics_test, elapsed_time)
-        model_id = save_results(result_folder, results, ml_ngx)
-        
-        # 8. Create final model and save it
-        if model_id > 0:
-            filepath = create_model_filename(model_folder, model_id, task, ml_algo)
-            fnl_clf = ml_ngx.create_and_save_model(filepath, dataset, pipeline_setup, model_classes, model_state)
+        # Stopwords removal changes the vocabulary blocks, so one full matrix is created per value
+        for remove_stopwords in sorted(set([subset["remove_stopwords"] for subset in task_subsets])):
+            group = [subset for subset in task_subsets if subset["remove_stopwords"] == remove_stopwords]
+            full_setup = {k: any([subset[k] for subset in group]) if type(v) is bool else v for k, v in base_setup.items()}
+            full_setup["remove_stopwords"] = remove_stopwords
             
-            #  9. Use model (make predictions)
-            pass
-    
-        logger.log_info(">> Scenario ends")
-        logger.log_info("- Elapsed time: %s seconds" % (time.time() - start_time))
+            # 2. Read full dataset (all the feature blocks used by the subsets)
+            full_dataset, label_dict = ml_ngx.create_dataset(data_folder, y_label, create_dataset, full_setup, True)
+            model_classes = [*label_dict.values()]
+            logger.log_info("- Feature family index: " + str(full_dataset.get_family_index()))
+            
+            # The full matrix is shared by the subsets (converted to a dense dataframe only once)
+            dataset = full_dataset if sparse_dataset else full_dataset.to_dataframe(ml_ngx.label_column)
+            
+            for feat_setup in group:
+                start_time = time.time()
+                logger.log_info("\n>> Scenario begins: " + get_curr_dataset_name(feat_setup))
+                
+                # Select the column blocks of the current subset (first step of the model pipeline, no dataset copy)
+                blocks = [block.value for block in FeatureBlock if feat_setup[block.value]]
+                ml_ngx.set_column_index(full_dataset.get_column_index(blocks))
+                
+                # 3-7. Split dataset, train and test model, and save results (and index the scenario)
+                model_id = run_scenario(ml_ngx, task, dataset, model_classes, feat_setup, pipeline_setup, train_setup, result_folder, start_time)
+                if model_id > 0:
+                    save_result_key(logger, {**app_setup, "features": feat_setup}, task, model_id, RunMode.ABLATION.value)
+                
+                logger.log_info(">> Scenario ends")
+                logger.log_info("- Elapsed time: %s seconds" % (time.time() - start_time))
+        
+        logger.log_info(">> Ablation ends")
 
 #####################
 ### START PROGRAM ###
@@ -155,7 +516,13 @@ if __name__ == "__main__":
     logger.log_info("\n>> START PROGRAM")
     app_setup = read_app_setup()
     
-    if len(app_setup):
+    if len(app_setup) and app_setup["sweep"]:
+        start_sweep(logger, app_setup)
+    elif len(app_setup) and len(app_setup["ablation"]):
+        start_ablation(logger, app_setup)
+    elif len(app_setup) and app_setup["train"]["streaming"]["enabled"]:
+        start_stream_app(logger, app_setup)
+    elif len(app_setup):
         start_app(logger, app_setup)
     else:
         logger.log_error(">> ERROR - The application configuration could not be read.")
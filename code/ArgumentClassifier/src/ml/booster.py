@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""
+    Created by: Andrés Segura-Tinoco
+    Version: 0.3.0
+    Created on: Oct 18, 2026
+    Updated on: Oct 18, 2026
+    Description: LightGBM native classifier of the ML engine (early stopping and binary Dataset cache).
+"""
+
+# Import Python base libraries
+import os
+import math
+import hashlib
+import numpy as np
+import scipy.sparse as sp
+
+# Import ML libraries
+import lightgbm as lgb
+from sklearn.base import BaseEstimator, ClassifierMixin
+from sklearn.model_selection import train_test_split
+
+# LGBMClassifier param names (and aliases used by the engine) and their LightGBM native names
+PARAM_NAMES = {"min_child_samples": "min_data_in_leaf", "min_samples_leaf": "min_data_in_leaf", "colsample_bytree": "feature_fraction",
+               "subsample": "bagging_fraction", "subsample_freq": "bagging_freq", "reg_alpha": "lambda_l1", "reg_lambda": "lambda_l2",
+               "min_split_gain": "min_gain_to_split"}
+
+# Dataset params (fixed, so a binned Dataset can be reused by any set of booster params)
+DATASET_PARAMS = {"max_bin": 255, "feature_pre_filter": False, "verbosity": -1}
+
+# Native LightGBM classifier: early stopping on a stratified validation slice, binned train Datasets cached in LightGBM binary format
+class BoosterClassifier(ClassifierMixin, BaseEstimator):
+    
+    # Constructor
+    def __init__(self, n_estimators:int=100, early_stopping_rounds:int=0, valid_size:float=0.1, cache_folder:str="", cache_size_mb:int=0, random_state:int=None, n_jobs:int=None, **params):
+        self.n_estimators = n_estimators
+        self.early_stopping_rounds = early_stopping_rounds
+        self.valid_size = valid_size
+        self.cache_folder = cache_folder
+        self.cache_size_mb = cache_size_mb
+        self.random_state = random_state
+        self.n_jobs = n_jobs
+        self._other_params = params
+    
+    # Return the estimator params (including the booster params)
+    def get_params(self, deep:bool=True) -> dict:
+        params = super().get_params(deep)
+        params.update(self._other_params)
+        return params
+    
+    # Set the estimator params (unknown ones are booster params)
+    def set_params(self, **params):
+        for key, value in params.items():
+            if key in self._get_param_names():
+                setattr(self, key, value)
+            else:
+                self._other_params[key] = value
+        return self
+    
+    # Util function - Return the hash key of a train set (data and labels)
+    def __get_key(self, X, y:np.ndarray) -> str:
+        sha = hashlib.sha1(str(X.shape).encode("utf-8"))
+        
+        if sp.issparse(X):
+            X = X.tocsr()
+            for values in [X.data, X.indices, X.indptr]:
+                sha.update(np.ascontiguousarray(values).tobytes())
+        else:
+            sha.update(np.ascontiguousarray(X).tobytes())
+        sha.update(np.ascontiguousarray(y).tobytes())
+        
+        return sha.hexdigest()[:16]
+    
+    # Util function - Evict the least recently used binary Datasets (except the current one) while the cache is over its size bound (0: unbounded)
+    def __reduce_cache_size(self, curr_filepath:str):
+        if self.cache_size_mb <= 0:
+            return
+        
+        files = []
+        for file in os.listdir(self.cache_folder):
+            if file.startswith("lgb-") and file.endswith(".bin"):
+                try:
+                    stat = os.stat(self.cache_folder + file)
+                    files.append((stat.st_mtime, stat.st_size, self.cache_folder + file))
+                except OSError:
+                    pass
+        
+        cache_size = sum([size for _, size, _ in files])
+        for _, size, filepath in sorted(files):
+            if cache_size <= self.cache_size_mb * 1024 * 1024:
+                break
+            if filepath == curr_filepath:
+                continue
+            try:
+                os.remove(filepath)
+            except OSError:
+                pass
+            cache_size -= size
+    
+    # Util function - Return the validation split mode: "stratified" if every class fits in both slices, "random" if stratification
+    # is not possible (classes with fewer than 2 rows, or more classes than rows in a slice), and "" if the data is too small to split
+    def __get_valid_split(self, y:np.ndarray) -> str:
+        n_rows = len(y)
+        n_valid = math.ceil(self.valid_size * n_rows) if isinstance(self.valid_size, float) else int(self.valid_size)
+        n_train = n_rows - n_valid
+        n_classes = len(self.classes_)
+        split = ""
+        
+        if n_valid >= n_classes and n_train >= n_classes and np.bincount(y).min() >= 2:
+            split = "stratified"
+        elif n_valid >= 1 and n_train >= 1:
+            split = "random"
+        
+        return split
+    
+    # Core function - Return the binned train Dataset (loaded from the binary cache if possible)
+    def __get_train_set(self, X, y:np.ndarray) -> lgb.Dataset:
+        
+        if not self.cache_folder:
+            return lgb.Dataset(X, label=y, params=DATASET_PARAMS).construct()
+        
+        if not os.path.exists(self.cache_folder):
+            os.makedirs(self.cache_folder, exist_ok=True)
+        
+        # Hashing the matrix is an order of magnitude cheaper than binning it
+        filepath = self.cache_folder + "lgb-" + self.__get_key(X, y) + ".bin"
+        if os.path.exists(filepath):
+            train_set = lgb.Dataset(filepath, params=DATASET_PARAMS).construct()
+            os.utime(filepath)
+        else:
+            # Written to a temporary file first (concurrent CV workers may bin the same fold)
+            train_set = lgb.Dataset(X, label=y, params=DATASET_PARAMS).construct()
+            train_set.save_binary(filepath + "." + str(os.getpid()) + ".tmp")
+            os.replace(filepath + "." + str(os.getpid()) + ".tmp", filepath)
+            self.__reduce_cache_size(filepath)
+        
+        return train_set
+    
+    # Core function - Return the booster params
+    def __get_booster_params(self) -> dict:
+        params = {PARAM_NAMES.get(k, k): v for k, v in self._other_params.items()}
+        params.update({"verbosity": -1, "seed": self.random_state, "num_threads": self.n_jobs or 0})
+        
+        if len(self.classes_) > 2:
+            params.update({"objective": "multiclass", "num_class": len(self.classes_)})
+        else:
+            params["objective"] = "binary"
+        
+        return params
+    
+    # ML function - Train the booster (with early stopping if early_stopping_rounds > 0), or continue training init_model
+    def fit(self, X, y, init_model:lgb.Booster=None):
+        self.classes_, y = np.unique(y, return_inverse=True)
+        params = self.__get_booster_params()
+        valid_sets = []
+        callbacks = []
+        
+        # Validation slice (stratified if possible, small folds without a valid split are trained without early stopping)
+        self.valid_split_ = self.__get_valid_split(y) if self.early_stopping_rounds > 0 else ""
+        if self.valid_split_:
+            stratify = y if self.valid_split_ == "stratified" else None
+            X, X_valid, y, y_valid = train_test_split(X, y, test_size=self.valid_size, stratify=stratify, random_state=self.random_state)
+        
+        # Continued training needs the raw data (init scores), the binary cache is not used
+        train_set = self.__get_train_set(X, y) if init_model is None else lgb.Dataset(X, label=y, params=DATASET_PARAMS, free_raw_data=False)
+        if self.valid_split_:
+            valid_sets.append(lgb.Dataset(X_valid, label=y_valid, reference=train_set, params=DATASET_PARAMS))
+            callbacks.append(lgb.early_stopping(self.early_stopping_rounds, verbose=False))
+        
+        self.booster_ = lgb.train(params, train_set, num_boost_round=self.n_estimators, valid_sets=valid_sets, callbacks=callbacks, init_model=init_model)
+        self.best_iteration_ = self.booster_.best_iteration if self.booster_.best_iteration > 0 else self.booster_.current_iteration()
+        self.n_features_in_ = X.shape[1]
+        
+        return self
+    
+    # ML function - Predict class probabilities (with the best iteration)
+    def predict_proba(self, X) -> np.ndarray:
+        proba = self.booster_.predict(X, num_iteration=self.best_iteration_)
+        
+        if len(self.classes_) == 2:
+            proba = np.vstack([1.0 - proba, proba]).T
+        
+        return proba
+    
+    # ML function - Predict classes
+    def predict(self, X) -> np.ndarray:
+        return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
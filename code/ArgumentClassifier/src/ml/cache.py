@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+    Created by: Andrés Segura-Tinoco
+    Version: 0.1.0
+    Created on: Oct 18, 2026
+    Updated on: Oct 18, 2026
+    Description: Binary cache of the ML engine datasets and feature blocks.
+"""
+
+# Import Custom libraries
+from util import files as ufl
+from ml.dataset import SparseDataset
+import ml.logging as mll
+
+# Import Python base libraries
+import os
+import json
+import hashlib
+import scipy.sparse as sp
+
+# Dataset cache class (sparse .npz matrices plus .json sidecars, keyed by the dataset or block setup)
+class DatasetCache:
+    
+    # Constructor
+    def __init__(self, cache_folder:str, logger:mll.MLLog):
+        self.cache_folder = cache_folder
+        self.logger = logger
+        
+        if not os.path.exists(self.cache_folder):
+            os.makedirs(self.cache_folder)
+    
+    # Return the hash key of a setup (any JSON serializable dict) and a list of input files
+    def get_key(self, setup:dict, filepaths:list) -> str:
+        fingerprints = {os.path.basename(fp): ufl.get_file_fingerprint(fp) for fp in filepaths}
+        content = json.dumps({"setup": setup, "files": fingerprints}, sort_keys=True)
+        key = hashlib.sha1(content.encode("utf-8")).hexdigest()[:16]
+        return key
+    
+    # Return the base file path of a cached dataset
+    def get_dataset_path(self, key:str) -> str:
+        return self.cache_folder + "dataset-" + key
+    
+    # Load a cached dataset, return None on cache miss
+    def load_dataset(self, key:str) -> SparseDataset:
+        dataset = SparseDataset.load(self.get_dataset_path(key))
+        
+        if dataset is not None:
+            self.logger.log_info("- Dataset loaded from cache: " + key)
+        else:
+            self.logger.log_info("- Dataset not found in cache: " + key)
+        
+        return dataset
+    
+    # Save a dataset in the cache
+    def save_dataset(self, key:str, dataset:SparseDataset, metadata:dict=None) -> bool:
+        result = dataset.save(self.get_dataset_path(key), metadata)
+        
+        if result:
+            self.logger.log_info("- Dataset saved to cache: " + key)
+        
+        return result
+    
+    # Return the base file path of a cached feature block
+    def get_block_path(self, block:str, key:str) -> str:
+        return self.cache_folder + "block-" + block + "-" + key
+    
+    # Load a cached feature block (matrix and columns), return None on cache miss
+    def load_block(self, block:str, key:str) -> tuple:
+        result = None
+        filepath = self.get_block_path(block, key)
+        
+        if os.path.exists(filepath + ".npz") and os.path.exists(filepath + ".json"):
+            sidecar = ufl.get_dict_from_json(filepath + ".json")
+            if len(sidecar):
+                result = sp.load_npz(filepath + ".npz").tocsr(), sidecar["columns"]
+        
+        return result
+    
+    # Save a feature block (matrix and columns) in the cache
+    def save_block(self, block:str, key:str, matrix:sp.csr_matrix, columns:list) -> bool:
+        filepath = self.get_block_path(block, key)
+        sp.save_npz(filepath + ".npz", matrix, compressed=False)
+        result = ufl.save_dict_to_json(filepath + ".json", {"block": block, "columns": columns})
+        return result
@@ -1,9 +1,9 @@
 # -*- coding: utf-8 -*-
 """
     Created by: Andrés Segura-Tinoco
-    Version: 0.6.0
+    Version: 0.13.0
     Created on: Oct 19, 2021
-    Updated on: Mar 22, 2023
+    Updated on: Oct 18, 2026
     Description: ML engine contants.
 """
 
@@ -33,6 +33,8 @@ class ModelType(enum.Enum):
 class ScaleData(enum.Enum):
     NORMALIZE = "normalize"
     STANDARDIZE = "standardize"
+    MAX_ABS = "max-abs"
+    UNIT_VARIANCE = "unit-variance"
     
     def __str__(self):
         return self.value
@@ -42,6 +44,93 @@ class DimReduction(enum.Enum):
     LDA = "lda"
     PCA = "pca"
     SVD = "svd"
+    IPCA = "incremental-pca"
     
     def __str__(self):
         return self.value
+
+# Using enum class create the kernel approximations (feature maps) enumeration
+class KernelApprox(enum.Enum):
+    NYSTROEM = "nystroem"
+    RBF_SAMPLER = "rbf-sampler"
+    
+    def __str__(self):
+        return self.value
+
+# Using enum class create the feature selection algorithms enumeration
+class FeatureSelection(enum.Enum):
+    CHI2 = "chi2"
+    MUTUAL_INFO = "mutual-info"
+    
+    def __str__(self):
+        return self.value
+
+# Using enum class create the hyperparameter search strategies enumeration
+class SearchStrategy(enum.Enum):
+    GRID = "grid"
+    HALVING = "halving"
+    RANDOM = "random"
+    
+    def __str__(self):
+        return self.value
+
+# Using enum class create the final model creation modes enumeration
+class FinalModel(enum.Enum):
+    REFIT = "refit"
+    REUSE = "reuse"
+    WARM_START = "warm-start"
+    
+    def __str__(self):
+        return self.value
+
+# Using enum class create the run modes enumeration (the ablation mode evaluates scenarios without saving their final models)
+class RunMode(enum.Enum):
+    APP = "app"
+    ABLATION = "ablation"
+    
+    def __str__(self):
+        return self.value
+
+# Using enum class create the feature blocks enumeration (in dataset column order)
+class FeatureBlock(enum.Enum):
+    BOW_UNIGRAMS = "bow_unigrams"
+    BOW_BIGRAMS = "bow_bigrams"
+    BOW_TRIGRAMS = "bow_trigrams"
+    POS_UNIGRAMS = "pos_unigrams"
+    POS_BIGRAMS = "pos_bigrams"
+    WORD_COUPLES = "word_couples"
+    ENTITIES = "entities"
+    ADVERBS = "adverbs"
+    VERBS = "verbs"
+    NOUNS = "nouns"
+    PUNCTUATION = "punctuation"
+    KEY_WORDS = "key_words"
+    STRUC_STATS = "struc_stats"
+    SYNT_STATS = "synt_stats"
+    
+    def __str__(self):
+        return self.value
+
+# Feature families (column prefixes) and their feature blocks
+FEATURE_FAMILIES = {
+    "bow": [FeatureBlock.BOW_UNIGRAMS.value, FeatureBlock.BOW_BIGRAMS.value, FeatureBlock.BOW_TRIGRAMS.value, FeatureBlock.WORD_COUPLES.value],
+    "pos": [FeatureBlock.POS_UNIGRAMS.value, FeatureBlock.POS_BIGRAMS.value],
+    "ent": [FeatureBlock.ENTITIES.value],
+    "avb": [FeatureBlock.ADVERBS.value],
+    "vb": [FeatureBlock.VERBS.value],
+    "nns": [FeatureBlock.NOUNS.value],
+    "pm": [FeatureBlock.PUNCTUATION.value],
+    "kw": [FeatureBlock.KEY_WORDS.value],
+    "struc": [FeatureBlock.STRUC_STATS.value],
+    "synt": [FeatureBlock.SYNT_STATS.value]
+}
+
+# Vocabulary feature blocks (BoW and PoS tokens)
+VOCABULARY_BLOCKS = [FeatureBlock.BOW_UNIGRAMS.value, FeatureBlock.BOW_BIGRAMS.value, FeatureBlock.BOW_TRIGRAMS.value,
+                     FeatureBlock.POS_UNIGRAMS.value, FeatureBlock.POS_BIGRAMS.value, FeatureBlock.WORD_COUPLES.value]
+
+# Numeric feature blocks and their (ordered) columns
+NUMERIC_COLUMNS = {
+    FeatureBlock.STRUC_STATS.value: ["struc_modal_auxiliary", "struc_text_length", "struc_text_position", "struc_token_count", "struc_avg_word_length", "struc_punct_marks_count"],
+    FeatureBlock.SYNT_STATS.value: ["synt_parse_tree_depth", "synt_sub_clauses_count"]
+}
@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+"""
+    Created by: Andrés Segura-Tinoco
+    Version: 0.6.0
+    Created on: Oct 18, 2026
+    Updated on: Oct 18, 2026
+    Description: Sparse dataset of the ML engine.
+"""
+
+# Import Custom libraries
+from util import files as ufl
+from util import ml as uml
+from ml.constant import FEATURE_FAMILIES, NUMERIC_COLUMNS
+
+# Import Python base libraries
+import os
+from array import array
+from collections import Counter
+from collections.abc import Sequence
+from bisect import bisect_right
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+
+# Lazy column names of a hashed feature space: "<block>#<ix>" for the hashed token blocks and the numeric column names,
+# generated on access from the block ranges (2^hash_bits names per token block are never materialized nor saved)
+class HashedColumns(Sequence):
+    
+    # Constructor
+    def __init__(self, blocks:dict, hash_bits:int):
+        self.hash_bits = hash_bits
+        self.ranges = sorted([(start, end, block) for block, (start, end) in blocks.items()])
+        self.starts = [start for start, end, block in self.ranges]
+        self.n_columns = max([end for start, end, block in self.ranges], default=0)
+    
+    # Number of columns
+    def __len__(self) -> int:
+        return self.n_columns
+    
+    # Return the name of a column (or the list of names of a slice)
+    def __getitem__(self, ix):
+        if isinstance(ix, slice):
+            return [self[i] for i in range(*ix.indices(self.n_columns))]
+        
+        ix = ix + self.n_columns if ix < 0 else ix
+        if not 0 <= ix < self.n_columns:
+            raise IndexError("Column index out of range: " + str(ix))
+        
+        start, end, block = self.ranges[bisect_right(self.starts, ix) - 1]
+        return NUMERIC_COLUMNS[block][ix - start] if block in NUMERIC_COLUMNS else block + "#" + str(ix - start)
+
+# Sparse dataset class (CSR feature matrix + labels + column metadata)
+class SparseDataset:
+    
+    # Constructor
+    def __init__(self, X:sp.csr_matrix, y:np.ndarray, columns:list, blocks:dict=None):
+        self.X = X
+        self.y = y
+        self.columns = columns
+        self.blocks = blocks if blocks is not None else {}
+    
+    # Create a dataset stacking a list of feature blocks (name, matrix, columns) only once (hashed spaces use lazy column names)
+    @classmethod
+    def from_blocks(cls, feat_blocks:list, labels:list, hash_bits:int=0):
+        matrices = []
+        columns = []
+        blocks = {}
+        n_columns = 0
+        
+        for name, matrix, block_columns in feat_blocks:
+            matrices.append(matrix)
+            blocks[name] = (n_columns, n_columns + matrix.shape[1])
+            n_columns += matrix.shape[1]
+            if not hash_bits:
+                columns += list(block_columns)
+        
+        X = sp.hstack(matrices, format="csr", dtype=np.float64) if len(matrices) else sp.csr_matrix((len(labels), 0))
+        y = np.array(labels)
+        columns = HashedColumns(blocks, hash_bits) if hash_bits else columns
+        
+        return cls(X, y, columns, blocks)
+    
+    # Number of records
+    def __len__(self) -> int:
+        return self.X.shape[0]
+    
+    # Short description of the dataset
+    def __str__(self) -> str:
+        n_rows, n_cols = self.X.shape
+        blocks = ", ".join(["%s: %s" % (k, e - s) for k, (s, e) in self.blocks.items()])
+        return "[%s rows x %s columns, %s non-zeros] {%s}" % (n_rows, n_cols, self.X.nnz, blocks)
+    
+    # Return the dataset shape
+    @property
+    def shape(self) -> tuple:
+        return self.X.shape
+    
+    # Calculate the sparsity of the feature matrix
+    def get_sparsity(self) -> float:
+        return uml.calc_sparse_sparsity(self.X)
+    
+    # Return a new dataset with the selected rows (keeping the given order)
+    def select_rows(self, rows:list):
+        rows = np.asarray(rows, dtype=int)
+        return SparseDataset(self.X[rows], self.y[rows], self.columns, self.blocks)
+    
+    # Return the column index of the selected feature blocks (in block order)
+    def get_column_index(self, blocks:list) -> np.ndarray:
+        col_ranges = [np.arange(*self.blocks[name]) for name in blocks if name in self.blocks]
+        return np.concatenate(col_ranges) if len(col_ranges) else np.array([], dtype=int)
+    
+    # Return a new dataset with the selected feature blocks (columns are gathered by block range, without featurization)
+    def select_blocks(self, blocks:list):
+        columns = []
+        new_blocks = {}
+        
+        for name in blocks:
+            if name in self.blocks:
+                start, end = self.blocks[name]
+                new_blocks[name] = (len(columns), len(columns) + end - start)
+                columns += self.columns[start:end]
+        
+        # The full matrix is reused as it is if all blocks are selected
+        if len(columns) == len(self.columns) and list(new_blocks.values()) == list(self.blocks.values()):
+            return SparseDataset(self.X, self.y, self.columns, self.blocks)
+        
+        if isinstance(self.columns, HashedColumns):
+            columns = HashedColumns(new_blocks, self.columns.hash_bits)
+        
+        return SparseDataset(self.X[:, self.get_column_index(blocks)], self.y, columns, new_blocks)
+    
+    # Return the column ranges of each feature family (bow, pos, ent, avb, vb, nns, pm, kw, struc, synt)
+    def get_family_index(self) -> dict:
+        index = {}
+        
+        for family, blocks in FEATURE_FAMILIES.items():
+            ranges = [self.blocks[name] for name in blocks if name in self.blocks]
+            if len(ranges):
+                index[family] = ranges
+        
+        return index
+    
+    # Convert the sparse dataset to a dense pandas DataFrame with the label as last column
+    def to_dataframe(self, label_column:str) -> pd.DataFrame:
+        df = pd.DataFrame(self.X.toarray(), columns=list(self.columns))
+        df[label_column] = self.y
+        return df
+    
+    # Return the sidecar column fields: the column names, or the hash bits of a hashed space (names are generated from the blocks)
+    def __get_column_fields(self) -> dict:
+        if isinstance(self.columns, HashedColumns):
+            return {"columns": None, "hash_bits": self.columns.hash_bits}
+        return {"columns": self.columns, "hash_bits": 0}
+    
+    # Return the column names of a sidecar
+    @staticmethod
+    def __read_columns(sidecar:dict, blocks:dict):
+        hash_bits = sidecar.get("hash_bits", 0)
+        return HashedColumns(blocks, hash_bits) if hash_bits else sidecar["columns"]
+    
+    # Save the dataset to disk: CSR matrix (.npz) plus columns/labels sidecar (.json)
+    def save(self, filepath:str, metadata:dict=None) -> bool:
+        sp.save_npz(filepath + ".npz", self.X, compressed=False)
+        sidecar = {**self.__get_column_fields(), "labels": self.y.tolist(), "blocks": self.blocks, "metadata": metadata or {}}
+        result = ufl.save_dict_to_json(filepath + ".json", sidecar)
+        return result
+    
+    # Load a dataset from disk, return None if it does not exist
+    @classmethod
+    def load(cls, filepath:str):
+        dataset = None
+        
+        if os.path.exists(filepath + ".npz") and os.path.exists(filepath + ".json"):
+            sidecar = ufl.get_dict_from_json(filepath + ".json")
+            
+            if len(sidecar):
+                X = sp.load_npz(filepath + ".npz").tocsr().astype(np.float64, copy=False)
+                blocks = {k: tuple(v) for k, v in sidecar["blocks"].items()}
+                dataset = cls(X, np.array(sidecar["labels"]), cls.__read_columns(sidecar, blocks), blocks)
+        
+        return dataset
+
+    # Save the CSR arrays as .npy files in a folder (to be memory-mapped read-only by worker processes)
+    def save_arrays(self, folder:str) -> bool:
+        np.save(folder + "data.npy", self.X.data)
+        np.save(folder + "indices.npy", self.X.indices)
+        np.save(folder + "indptr.npy", self.X.indptr)
+        sidecar = {"shape": list(self.X.shape), **self.__get_column_fields(), "labels": self.y.tolist(), "blocks": self.blocks}
+        result = ufl.save_dict_to_json(folder + "dataset.json", sidecar)
+        return result
+    
+    # Load a dataset whose CSR arrays are memory-mapped (no copy of the matrix is read into memory)
+    @classmethod
+    def load_arrays(cls, folder:str, mmap_mode:str="r"):
+        sidecar = ufl.get_dict_from_json(folder + "dataset.json")
+        arrays = [np.load(folder + name + ".npy", mmap_mode=mmap_mode) for name in ["data", "indices", "indptr"]]
+        X = sp.csr_matrix(tuple(arrays), shape=tuple(sidecar["shape"]), copy=False)
+        blocks = {k: tuple(v) for k, v in sidecar["blocks"].items()}
+        return cls(X, np.array(sidecar["labels"]), cls.__read_columns(sidecar, blocks), blocks)
+
+# Incremental builder of a sparse feature block: token counts (like CountVectorizer) or fixed numeric columns
+class SparseBlockBuilder:
+    
+    # Constructor
+    def __init__(self, columns:list=None):
+        self.columns = columns
+        self.vocabulary = {}
+        self.indices = array("i")
+        self.data = array("q")
+        self.indptr = array("q", [0])
+        self.rows = []
+    
+    # Number of added rows
+    def __len__(self) -> int:
+        return len(self.rows) if self.columns is not None else len(self.indptr) - 1
+    
+    # Add a row: a list of tokens or a list of numeric values (one per column)
+    def add_row(self, values:list):
+        
+        if self.columns is not None:
+            self.rows.append(values)
+        else:
+            for token, count in Counter(values).items():
+                self.indices.append(self.vocabulary.setdefault(token, len(self.vocabulary)))
+                self.data.append(count)
+            self.indptr.append(len(self.indices))
+    
+    # Build the CSR matrix and its column names (tokens are sorted alphabetically)
+    def build(self) -> tuple:
+        n_rows = len(self)
+        
+        if self.columns is not None:
+            matrix = sp.csr_matrix(np.array(self.rows).reshape(n_rows, len(self.columns)))
+            columns = list(self.columns)
+        else:
+            columns = sorted(self.vocabulary)
+            col_map = np.empty(len(columns), dtype=np.int32)
+            col_map[[self.vocabulary[token] for token in columns]] = np.arange(len(columns), dtype=np.int32)
+            
+            indices = col_map[np.frombuffer(self.indices, dtype=np.int32)]
+            data = np.frombuffer(self.data, dtype=np.int64)
+            indptr = np.frombuffer(self.indptr, dtype=np.int64)
+            matrix = sp.csr_matrix((data, indices, indptr), shape=(n_rows, len(columns)))
+            matrix.sort_indices()
+        
+        return matrix, columns
@@ -1,9 +1,9 @@
 # -*- coding: utf-8 -*-
 """
     Created by: Andrés Segura-Tinoco
-    Version: 1.4.1
+    Version: 1.29.0
     Created on: Oct 07, 2021
-    Updated on: Apr 06, 2023
+    Updated on: Oct 18, 2026
     Description: ML engine class.
 """
 
@@ -13,28 +13,43 @@ from util import ml as uml
 from ml.constant import TaskType
 import ml.utility as mlu
 import ml.logging as mll
-from ml.constant import ModelType, DimReduction, ScaleData
+import ml.stemmer as mls
+from ml.constant import ModelType, DimReduction, ScaleData, FeatureSelection, SearchStrategy, FinalModel, RunMode, FeatureBlock, VOCABULARY_BLOCKS, NUMERIC_COLUMNS
+from ml.dataset import SparseDataset, SparseBlockBuilder
+from ml.cache import DatasetCache
+from ml.featurizer import Featurizer
+from ml.search import BudgetSearch
+from ml.booster import BoosterClassifier
+from ml.reducer import IncrementalReducer
+from ml.kernel import ApproxKernelSVC
+import ml.featurizer as mlf
 
 # Import Python base libraries
 import os
+import time
+from functools import partial
 import numpy as np
 import pandas as pd
+import scipy.sparse as sp
 import joblib as jl
 
 # Import ML libraries
-from nltk.stem import SnowballStemmer
 from sklearn.model_selection import train_test_split, StratifiedShuffleSplit
 from sklearn.model_selection import GridSearchCV
+from threadpoolctl import threadpool_limits
 
 # Import data transformers
 from sklearn.preprocessing import Binarizer
-from sklearn.preprocessing import MinMaxScaler, StandardScaler
+from sklearn.preprocessing import MinMaxScaler, StandardScaler, MaxAbsScaler
 from sklearn.decomposition import PCA, TruncatedSVD
+from sklearn.feature_selection import GenericUnivariateSelect, chi2, mutual_info_classif
 from sklearn.discriminant_analysis import LinearDiscriminantAnalysis as LDA
 
 # Import ML algorithms
+from sklearn.base import clone
 from sklearn.pipeline import Pipeline
-from sklearn.linear_model import LogisticRegression
+from sklearn.compose import ColumnTransformer
+from sklearn.linear_model import LogisticRegression, SGDClassifier
 from sklearn.naive_bayes import MultinomialNB
 from sklearn.svm import SVC
 from lightgbm import LGBMClassifier   # https://lightgbm.readthedocs.io/en/latest/Parameters.html
@@ -43,25 +58,67 @@ from lightgbm import LGBMClassifier   # https://lightgbm.readthedocs.io/en/lates
 class MLEngine:
     
     # Constructor
-    def __init__(self, language:str, task_type:str, logger:mll.MLLog):
+    def __init__(self, language:str, task_type:str, logger:mll.MLLog, stem_setup:dict=None, parallel_setup:dict=None):
         self.encoding = "utf-8"
         self.label_column = "label"
         self.language = language
         self.opt_metric = "f1_weighted"   # https://scikit-learn.org/stable/modules/model_evaluation.html
         self.task_type = task_type
         self.logger = logger
+        self.stem_setup = stem_setup if stem_setup is not None else {"max_size": 100000, "persist": False}
+        self.featurizer = None
+        self.model = None
+        self.model_setup = {}
         self.mislabeled_records = {"t1_error":[], "t2_error":[]}
+        self.search_info = {}
+        self.params_filepath = "../config/model_params.json"
+        self.cache_folder = ""
+        self.column_index = None
+        self.parallel_setup = self.__get_parallel_setup(parallel_setup if parallel_setup is not None else {})
         
     ######################
     ### UTIL FUNCTIONS ###
     ######################
     
-    # Read JSON file of features
-    def __read_feature_file(self, data_path:str) -> list:
-        filepath = data_path + "features.json"
-        features = ufl.get_list_from_json(filepath, self.encoding)
+    # Return the features file: JSON-lines (features.jsonl) if exists, or JSON array (features.json)
+    def __get_feature_filepath(self, data_path:str) -> str:
+        filepath = data_path + "features.jsonl"
+        if not os.path.exists(filepath):
+            filepath = data_path + "features.json"
+        return filepath
+    
+    # Read JSON file of features (generator of one feature record at a time)
+    def __read_feature_file(self, data_path:str):
+        filepath = self.__get_feature_filepath(data_path)
+        
+        if filepath.endswith(".jsonl"):
+            features = ufl.get_items_from_jsonl(filepath, self.encoding)
+        else:
+            features = ufl.get_items_from_json(filepath, self.encoding)
+        
         return features
     
+    # Read the feature records of the selected rows (all if rows is None) in chunks (generator of row indexes and feature records)
+    def __read_feature_chunks(self, data_path:str, rows:np.ndarray, n_rows:int, chunk_size:int):
+        selected = np.zeros(n_rows, dtype=bool)
+        if rows is not None:
+            selected[rows] = True
+        chunk_rows = []
+        chunk = []
+        
+        for ix, v in enumerate(self.__read_feature_file(data_path)):
+            if rows is None or (ix < n_rows and selected[ix]):
+                chunk_rows.append(ix)
+                chunk.append(v)
+                
+                if len(chunk) == chunk_size:
+                    yield np.array(chunk_rows), chunk
+                    chunk_rows = []
+                    chunk = []
+        
+        if len(chunk):
+            yield np.array(chunk_rows), chunk
+    
     # Read CSV file of labels
     def __read_label_file(self, data_path:str) -> list:
         labels = []
@@ -95,152 +152,186 @@ class MLEngine:
         stopwords = set(ufl.get_list_from_plain_file(filepath))
         return stopwords
     
-    # Core function - Create dataset
-    def __create_dataset(self, features:list, labels:list, y_label:str, feat_setup:dict, set_stopwords:set) -> pd.DataFrame:
+    # Return the input files from which the dataset is created
+    def __get_input_files(self, data_path:str) -> list:
+        filepaths = [self.__get_feature_filepath(data_path), data_path + "propositions.csv", data_path + "stopwords/" + self.language + ".txt"]
+        return filepaths
+    
+    # Return the effective parallel setup: cores of each scenario split between outer (CV/candidate) workers and inner (LightGBM/BLAS) threads
+    def __get_parallel_setup(self, parallel_setup:dict) -> dict:
+        n_cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count()
+        n_cores = max(1, n_cpus // max(1, parallel_setup.get("scenario_workers", 1)))
+        outer_jobs = parallel_setup.get("outer_jobs", 0)
+        inner_threads = parallel_setup.get("inner_threads", 0)
         
-        # Validation
-        if len(features) != len(labels):
-            self.logger.log_info("- The length of the data and the labels is different")
-            self.logger.log_info("  Features dataset length: " + str(len(features)) + ", and labels file length: " + str(len(labels)))
-            return None
+        # Automatic split (by default, one inner thread per outer worker)
+        if not outer_jobs:
+            outer_jobs = max(1, n_cores // inner_threads) if inner_threads else n_cores
+        if not inner_threads:
+            inner_threads = max(1, n_cores // outer_jobs)
         
-        # Temp variables
-        vcb_corpus = []
-        ent_mtx = []
-        adverbs_mtx = []
-        verbs_mtx = []
-        nouns_mtx = []
-        punct_mtx = []
-        key_words_mtx = []
-        modal_auxiliary = []
-        text_length = []
-        text_position = []
-        token_count = []
-        avg_word_length = []
-        punct_marks_count = []
-        parse_tree_depth = []
-        sub_clauses_count = []
-        label_list = []
-        
-        # Create stemmer
-        stemmer = SnowballStemmer(self.language)
-        
-        # Create corpus
-        for v, l in zip(features, labels):
-            label_data = l
-                
-            # Add vocabulary - BoW and PoS
-            feat_data = []
-            feat_data += v["bow_unigrams"] if feat_setup["bow_unigrams"] and len(v["bow_unigrams"]) > 0 else []
-            feat_data += v["bow_bigrams"] if feat_setup["bow_bigrams"] and len(v["bow_bigrams"]) > 0 else []
-            feat_data += v["bow_trigrams"] if feat_setup["bow_trigrams"] and len(v["bow_trigrams"]) > 0 else []
-            feat_data += v["pos_unigrams"] if feat_setup["pos_unigrams"] and len(v["pos_unigrams"]) > 0 else []
-            feat_data += v["pos_bigrams"] if feat_setup["pos_bigrams"] and len(v["pos_bigrams"]) > 0 else []
-            feat_data += v["word_couples"] if feat_setup["word_couples"] and len(v["word_couples"]) > 0 else []
-            
-            # Transform words to lower case, remove stopwords and save vocabulary (step -0)
-            vocabulary = [ele.lower() for ele in feat_data]
-            if feat_setup["remove_stopwords"] and set_stopwords:
-                vocabulary = [ele for ele in vocabulary if ele not in set_stopwords]
-            vcb_corpus.append(vocabulary)
-            
-            # Entities matrix
-            if feat_setup["entities"]:
-                ent_mtx.append(mlu.value_to_features(v["entities"], "ent"))
-            
-            # Adverbs matrix
-            if feat_setup["adverbs"]:
-                tokens = [stemmer.stem(ele) for ele in v["adverbs"]]
-                adverbs_mtx.append(mlu.value_to_features(tokens, "avb"))
+        return {"cores": n_cores, "outer_jobs": outer_jobs, "inner_threads": inner_threads, "backend": parallel_setup.get("backend", "loky")}
+    
+    # Return the joblib context of the model tuning (outer workers with bounded inner threads)
+    def __get_parallel_context(self):
+        backend = self.parallel_setup["backend"]
+        
+        if backend == "loky":
+            context = jl.parallel_config(backend=backend, inner_max_num_threads=self.parallel_setup["inner_threads"])
+        else:
+            context = jl.parallel_config(backend=backend)
+        
+        return context
+    
+    # Return the file path of the model setup of a saved model
+    def __get_model_setup_filepath(self, filepath:str) -> str:
+        return os.path.splitext(filepath)[0] + ".json"
+    
+    # Return the file path of the featurizer of a saved model
+    def __get_featurizer_filepath(self, filepath:str) -> str:
+        return os.path.splitext(filepath)[0] + "-featurizer.joblib"
+    
+    # Return the shared memoized stemmer (its cache file lives next to the stopword list)
+    def __get_stemmer(self, data_path:str) -> mls.CachedStemmer:
+        filepath = data_path + "stopwords/" + self.language + "_stems.json" if self.stem_setup["persist"] else ""
+        stemmer = mls.get_stemmer(self.language, self.stem_setup["max_size"], filepath)
+        return stemmer
+    
+    # Return the setup (cache key) of a feature block
+    def __get_block_setup(self, block:str, feat_setup:dict) -> dict:
+        block_setup = {"block": block, "language": self.language}
+        if block in VOCABULARY_BLOCKS:
+            block_setup["remove_stopwords"] = feat_setup["remove_stopwords"]
+        if block not in NUMERIC_COLUMNS and feat_setup["hash_bits"]:
+            block_setup["hash_bits"] = feat_setup["hash_bits"]
+        return block_setup
+    
+    # Core function - Create the incremental builder of a feature block
+    def __create_block_builder(self, block:str) -> SparseBlockBuilder:
+        
+        # Extra columns - structural and syntactic stats (fixed columns)
+        columns = NUMERIC_COLUMNS.get(block)
+        
+        return SparseBlockBuilder(columns)
+    
+    # Core function - Extract hashed feature blocks: chunks of feature records are featurized independently (in parallel) into a fixed-width space
+    def __create_hashed_blocks(self, data_path:str, blocks:list, feat_setup:dict, chunk_size:int=1000) -> tuple:
+        hash_bits = feat_setup["hash_bits"]
+        stopwords = self.__read_stopword_list(data_path) if feat_setup["remove_stopwords"] else set()
+        block_ranges = {}
+        n_columns = 0
+        
+        # Column ranges of the blocks (2^hash_bits columns per token block)
+        for block in blocks:
+            width = len(NUMERIC_COLUMNS[block]) if block in NUMERIC_COLUMNS else 1 << hash_bits
+            block_ranges[block] = (n_columns, n_columns + width)
+            n_columns += width
+        
+        featurizer = Featurizer(self.language, feat_setup, None, block_ranges, stopwords, self.stem_setup["max_size"], hash_bits)
+        chunks = (features for chunk_rows, features in self.__read_feature_chunks(data_path, None, 0, chunk_size))
+        
+        # The shared memoized stemmer is used in-process, worker processes get a copy and their stem cache updates are merged back
+        stemmer = self.__get_stemmer(data_path)
+        if self.parallel_setup["cores"] > 1:
+            results = jl.Parallel(n_jobs=self.parallel_setup["cores"])(jl.delayed(mlf.transform_chunk)(featurizer, features, stemmer) for features in chunks)
+            matrices = [matrix for matrix, updates in results]
+            for matrix, updates in results:
+                stemmer.merge(updates)
+        else:
+            matrices = [featurizer.transform(features, stemmer) for features in chunks]
+        X = sp.vstack(matrices, format="csr") if len(matrices) else sp.csr_matrix((0, n_columns))
+        
+        # Report and save stem cache
+        stemmer.log_stats(self.logger)
+        stemmer.save()
+        
+        # Split the matrix into its feature blocks
+        block_data = {}
+        for block, (start, end) in block_ranges.items():
+            matrix = X[:, start:end]
+            matrix.eliminate_zeros()
+            block_data[block] = (matrix, list(NUMERIC_COLUMNS[block]) if block in NUMERIC_COLUMNS else None)
+        
+        return block_data, X.shape[0]
+    
+    # Core function - Create dataset (assembled from cached feature blocks, only missing blocks are extracted, all of them if forced)
+    def __create_dataset(self, data_path:str, labels:list, y_label:str, feat_setup:dict, ds_cache:DatasetCache, force_create_dataset:bool=False) -> SparseDataset:
+        blocks = [block.value for block in FeatureBlock if feat_setup[block.value]]
+        block_files = [self.__get_feature_filepath(data_path), data_path + "stopwords/" + self.language + ".txt"]
+        block_keys = {}
+        block_data = {}
+        
+        # Read cached feature blocks (a forced dataset rebuilds and overwrites them)
+        for block in blocks:
+            block_keys[block] = ds_cache.get_key(self.__get_block_setup(block, feat_setup), block_files)
+            block_data[block] = ds_cache.load_block(block, block_keys[block]) if not force_create_dataset else None
+        
+        missing_blocks = [block for block in blocks if block_data[block] is None]
+        self.logger.log_info("- Cached feature blocks: " + str(len(blocks) - len(missing_blocks)) + ", missing blocks: " + str(missing_blocks))
+        
+        # Extract missing hashed feature blocks
+        if len(missing_blocks) and feat_setup["hash_bits"]:
+            hashed_data, n_features = self.__create_hashed_blocks(data_path, missing_blocks, feat_setup)
             
-            # Verbs matrix
-            if feat_setup["verbs"]:
-                tokens = [stemmer.stem(ele) for ele in v["verbs"]]
-                verbs_mtx.append(mlu.value_to_features(tokens, "vb"))
+            # Validation
+            if n_features != len(labels):
+                self.logger.log_info("- The length of the data and the labels is different")
+                self.logger.log_info("  Features dataset length: " + str(n_features) + ", and labels file length: " + str(len(labels)))
+                return None
             
-            # Nouns matrix
-            if feat_setup["nouns"]:
-                nouns_mtx.append(mlu.value_to_features(v["nouns"], "nns"))
+            # Save feature blocks
+            for block in missing_blocks:
+                block_data[block] = hashed_data[block]
+                ds_cache.save_block(block, block_keys[block], *block_data[block])
+        
+        # Extract missing feature blocks
+        elif len(missing_blocks):
+            features = self.__read_feature_file(data_path)
             
-            # Punctuation matrix
-            if feat_setup["punctuation"]:
-                punct_mtx.append(mlu.value_to_features(v["punctuation"], "pm"))
+            # Create (shared) memoized stemmer and read stopwords
+            stemmer = self.__get_stemmer(data_path)
+            set_stopwords = self.__read_stopword_list(data_path) if feat_setup["remove_stopwords"] else set()
             
-            # Keyword matrix (step -8)
-            if feat_setup["key_words"]:
-                key_words_mtx.append(mlu.value_to_features(v["key_words"], "kw"))
+            # Create corpus, one feature record at a time
+            builders = {block: self.__create_block_builder(block) for block in missing_blocks}
+            n_features = 0
+            for v in features:
+                for block in missing_blocks:
+                    builders[block].add_row(mlf.get_block_values(block, v, set_stopwords, stemmer))
+                n_features += 1
             
-            # Save structural features
-            if feat_setup["struc_stats"]:
-                modal_auxiliary.append(len(v["modal_auxs"]))
-                text_length.append(v["text_length"])
-                text_position.append(v["text_position"])
-                token_count.append(v["token_count"])
-                avg_word_length.append(v["avg_word_length"])
-                punct_marks_count.append(v["punct_marks_count"])
-                
-            # Save syntactic features
-            if feat_setup["synt_stats"]:
-                parse_tree_depth.append(v["parse_tree_depth"])
-                sub_clauses_count.append(v["sub_clauses_count"])
+            # Validation
+            if n_features != len(labels):
+                self.logger.log_info("- The length of the data and the labels is different")
+                self.logger.log_info("  Features dataset length: " + str(n_features) + ", and labels file length: " + str(len(labels)))
+                return None
             
-            # Save label
-            label_list.append(label_data[y_label].lower())
-        
-        # Create main dataframe
-        df = uml.create_df_from_sparse_matrix(vcb_corpus)
-        
-        # Add entities matrix to main df
-        if feat_setup["entities"]:
-            df_ent = uml.create_df_from_sparse_matrix(ent_mtx)
-            df = pd.concat([df, df_ent], axis=1)
-        
-        # Add adverbs matrix to main df
-        if feat_setup["adverbs"]:
-            df_adv = uml.create_df_from_sparse_matrix(adverbs_mtx)
-            df = pd.concat([df, df_adv], axis=1)
-        
-        # Add verbs matrix to main df
-        if feat_setup["verbs"]:
-            df_vb = uml.create_df_from_sparse_matrix(verbs_mtx)
-            df = pd.concat([df, df_vb], axis=1)
-        
-        # Add verbs matrix to main df
-        if feat_setup["nouns"]:
-            df_nns = uml.create_df_from_sparse_matrix(nouns_mtx)
-            df = pd.concat([df, df_nns], axis=1)
-        
-        # Add punctuation matrix to main df
-        if feat_setup["punctuation"]:
-            df_punct = uml.create_df_from_sparse_matrix(punct_mtx)
-            df = pd.concat([df, df_punct], axis=1)
-        
-        # Add keywords matrix to main df
-        if feat_setup["key_words"]:
-            df_kw = uml.create_df_from_sparse_matrix(key_words_mtx)
-            df = pd.concat([df, df_kw], axis=1)
-        
-        # Add extra columns - structural stats
-        if feat_setup["struc_stats"]:
-            df["struc_modal_auxiliary"] = modal_auxiliary
-            df["struc_text_length"] = text_length
-            df["struc_text_position"] = text_position
-            df["struc_token_count"] = token_count
-            df["struc_avg_word_length"] = avg_word_length
-            df["struc_punct_marks_count"] = punct_marks_count
+            # Create and save feature blocks
+            for block in missing_blocks:
+                block_data[block] = builders[block].build()
+                ds_cache.save_block(block, block_keys[block], *block_data[block])
             
-        # Add extra columns - syntactic stats
-        if feat_setup["synt_stats"]:
-            df["synt_parse_tree_depth"] = parse_tree_depth
-            df["synt_sub_clauses_count"] = sub_clauses_count
+            # Report and save stem cache
+            stemmer.log_stats(self.logger)
+            stemmer.save()
+        
+        # Validation
+        for block in blocks:
+            if block_data[block][0].shape[0] != len(labels):
+                self.logger.log_info("- The length of the feature block '" + block + "' and the labels is different")
+                return None
         
-        # Added label column
-        df[self.label_column] = label_list
+        # Save labels
+        label_list = [label_data[y_label].lower() for label_data in labels]
         
-        return df
+        # Stack all blocks only once (with label list)
+        feat_blocks = [(block, *block_data[block]) for block in blocks]
+        dataset = SparseDataset.from_blocks(feat_blocks, label_list, feat_setup["hash_bits"])
+        
+        return dataset
     
     # Core function - Apply filtering and data augmentation for task 3 (Argument Relation Classification)
-    def __data_augmentation(self, dataset:pd.DataFrame, labels:list) -> pd.DataFrame:
+    def __data_augmentation(self, dataset:SparseDataset, labels:list) -> SparseDataset:
         labels = [label for label in labels if label["sent_label2"].lower() != "spam"]
         # print(len(labels))
         # print(labels)
@@ -249,21 +340,133 @@ class MLEngine:
         # print(len(ind_keys))
         # print(ind_keys)
         
-        dataset = dataset[dataset.index.isin(ind_keys.keys())]
+        dataset = dataset.select_rows(sorted(ind_keys.keys()))
         # print(len(dataset))
         # print(dataset)
         
         return dataset
     
+    # Core function - Create the dataset of a task from the shared feature dataset (only the label vector and row mask change)
+    def __create_task_dataset(self, shared_dataset:SparseDataset, labels:list, y_label:str) -> SparseDataset:
+        label_list = [label_data[y_label].lower() for label_data in labels]
+        dataset = SparseDataset(shared_dataset.X, np.array(label_list), shared_dataset.columns, shared_dataset.blocks)
+        
+        # If is task3 then apply filter and data augmentation
+        if self.task_type == TaskType.REL_CLASSIFICATION.value:
+            dataset = self.__data_augmentation(dataset, labels)
+        
+        return dataset
+    
+    # Core function - Create the featurizer of the streaming mode: fixed vocabulary (one pass over the feature records) or hashed token spaces
+    def __create_stream_featurizer(self, data_path:str, feat_setup:dict) -> Featurizer:
+        hash_bits = feat_setup["hash_bits"]
+        blocks = [block.value for block in FeatureBlock if feat_setup[block.value]]
+        stopwords = self.__read_stopword_list(data_path) if feat_setup["remove_stopwords"] else set()
+        vocabularies = {block: set() for block in blocks if block not in NUMERIC_COLUMNS}
+        
+        # Only the vocabularies are kept in memory (tokens are sorted like SparseBlockBuilder does)
+        stemmer = self.__get_stemmer(data_path)
+        if not hash_bits:
+            for v in self.__read_feature_file(data_path):
+                for block, vocabulary in vocabularies.items():
+                    vocabulary.update(mlf.get_block_values(block, v, stopwords, stemmer))
+            stemmer.log_stats(self.logger)
+            stemmer.save()
+        
+        # Column ranges of the blocks
+        columns = [] if not hash_bits else None
+        block_ranges = {}
+        n_columns = 0
+        for block in blocks:
+            if block in NUMERIC_COLUMNS:
+                block_columns = NUMERIC_COLUMNS[block]
+            elif not hash_bits:
+                block_columns = sorted(vocabularies[block])
+            else:
+                block_columns = range(1 << hash_bits)
+            
+            block_ranges[block] = (n_columns, n_columns + len(block_columns))
+            n_columns += len(block_columns)
+            if columns is not None:
+                columns += list(block_columns)
+
+        # The chunks are featurized with the shared memoized stemmer (it is not saved with the featurizer)
+        featurizer = Featurizer(self.language, feat_setup, columns, block_ranges, stopwords, self.stem_setup["max_size"], hash_bits)
+        featurizer.stemmer = stemmer
+        self.logger.log_info("- Streaming featurizer: " + str(n_columns) + " columns, " + ("hashed (" + str(hash_bits) + " bits per block)" if hash_bits else "fixed vocabulary"))
+        
+        return featurizer
+    
+    # Core function - Create the model pipeline of the streaming mode (sparse scalers and models trained with partial_fit)
+    def __create_stream_model(self, pipeline_setup:dict, model_params:dict, n_rows:int, model_state:int) -> Pipeline:
+        ml_algo = pipeline_setup["ml_algo"]
+        data_scale_algo = pipeline_setup["data_scale_algo"]
+        
+        # Adding pipeline steps
+        estimators = []
+        
+        # 1. Add data scaler (only the sparse-preserving scalers are valid, see check_pipeline_setup)
+        if data_scale_algo == ScaleData.MAX_ABS.value:
+            estimators.append(("scaler", MaxAbsScaler()))
+        
+        elif data_scale_algo == ScaleData.UNIT_VARIANCE.value:
+            estimators.append(("scaler", StandardScaler(with_mean=False)))
+        
+        # 2. Add model (regularization strength C is turned into the SGD alpha)
+        if ml_algo == ModelType.NAIVE_BAYES.value:
+            model_params.pop("random_state", None)
+            estimators.append(("binarizer", Binarizer()))
+            estimators.append(("model", MultinomialNB(**model_params)))
+        
+        elif ml_algo == ModelType.LOG_REG.value:
+            alpha = 1.0 / (model_params.get("C", 1.0) * max(n_rows, 1))
+            estimators.append(("model", SGDClassifier(loss="log_loss", penalty=model_params.get("penalty", "l2"), alpha=alpha, random_state=model_state)))
+        
+        elif ml_algo == ModelType.SVM.value:
+            alpha = 1.0 / (model_params.get("C", 1.0) * max(n_rows, 1))
+            estimators.append(("model", SGDClassifier(loss="hinge", penalty="l2", alpha=alpha, random_state=model_state)))
+        
+        else:
+            self.logger.log_error("- Streaming mode: model '" + ml_algo + "' has no incremental training")
+            return None
+        
+        # Linear models are trained as SGD classifiers (the SVM kernel and the solver params do not apply)
+        if isinstance(estimators[-1][1], SGDClassifier):
+            self.logger.log_info("- Streaming mode: model '" + ml_algo + "' is trained as " + str(estimators[-1][1]))
+        
+        # Create model pipeline
+        pipe = Pipeline(estimators)
+        self.logger.log_info(str(pipe))
+        
+        return pipe
+    
+    # Util function - Return the effective params of a streaming model (the SGD params of the linear models, not their batch params)
+    def __get_stream_model_params(self, clf:Pipeline) -> dict:
+        model = clf.named_steps["model"]
+        params = model.get_params()
+        
+        if isinstance(model, SGDClassifier):
+            params = {"estimator": type(model).__name__, **{k: params[k] for k in ["loss", "penalty", "alpha", "random_state"]}}
+        
+        return params
+    
     # Core function - Create model pipeline with default params
-    def __create_model(self, pipeline_setup:dict, model_params:dict, model_classes:list) -> Pipeline:
+    def __create_model(self, pipeline_setup:dict, model_params:dict, model_classes:list, n_threads:int, memory:jl.Memory=None, booster_setup:dict=None, model_state:int=None) -> Pipeline:
         ml_algo = pipeline_setup["ml_algo"]
         data_scale_algo = pipeline_setup["data_scale_algo"]
         dim_red_algo = pipeline_setup["dim_red_algo"]
+        dim_red_comp = pipeline_setup["dim_red_comp"]
+        feat_sel_algo = pipeline_setup["feat_sel_algo"]
+        feat_sel_mode = pipeline_setup["feat_sel_mode"]
+        feat_sel_param = pipeline_setup["feat_sel_param"]
         
         # Adding pipeline steps
         estimators = []
         
+        # 0. Add column selector (feature ablation: the subset columns are taken from the full matrix inside the pipeline)
+        if self.column_index is not None:
+            estimators.append(("columns", ColumnTransformer([("subset", "passthrough", self.column_index)], sparse_threshold=1.0)))
+        
         # 1. Add data scaler
         if data_scale_algo == ScaleData.NORMALIZE.value:
             estimators.append(("scaler", MinMaxScaler()))
@@ -271,20 +474,43 @@ class MLEngine:
         elif data_scale_algo == ScaleData.STANDARDIZE.value:
             estimators.append(("scaler", StandardScaler()))
         
-        # 2. Add dim reducer
+        # Sparse-preserving scalers (no centering, zeros are kept)
+        elif data_scale_algo == ScaleData.MAX_ABS.value:
+            estimators.append(("scaler", MaxAbsScaler()))
+        
+        elif data_scale_algo == ScaleData.UNIT_VARIANCE.value:
+            estimators.append(("scaler", StandardScaler(with_mean=False)))
+        
+        # 2. Add supervised feature selector (top-k or percentile of the columns, fitted within each CV fold)
+        if feat_sel_algo == FeatureSelection.CHI2.value:
+            estimators.append(("selector", GenericUnivariateSelect(chi2, mode=feat_sel_mode, param=feat_sel_param)))
+        
+        elif feat_sel_algo == FeatureSelection.MUTUAL_INFO.value:
+            # Seeded by the scenario (the NB and LR params have no random_state), the dense-feature noise is reproducible
+            score_func = partial(mutual_info_classif, random_state=model_state)
+            estimators.append(("selector", GenericUnivariateSelect(score_func, mode=feat_sel_mode, param=feat_sel_param)))
+        
+        # 3. Add dim reducer
         if dim_red_algo == DimReduction.PCA.value:
-            n_comp = 100
-            estimators.append(("reducer", PCA(n_components=n_comp)))
+            n_comp = dim_red_comp
+            estimators.append(("reducer", PCA(n_components=n_comp, random_state=model_state)))
             
         elif dim_red_algo == DimReduction.SVD.value:
-            n_comp = 100
-            estimators.append(("reducer", TruncatedSVD(n_components=n_comp)))
+            # Randomized solver on the CSR matrix (time proportional to the non-zeros)
+            n_comp = dim_red_comp
+            estimators.append(("reducer", TruncatedSVD(n_components=n_comp, algorithm="randomized", random_state=model_state)))
+            
+        elif dim_red_algo == DimReduction.IPCA.value:
+            # Fitted batch by batch, and reused from the dataset cache folder for the same fitted matrix
+            n_comp = dim_red_comp
+            cache_folder = self.cache_folder + "reducer/" if self.cache_folder else ""
+            estimators.append(("reducer", IncrementalReducer(n_components=n_comp, batch_size=pipeline_setup["dim_red_batch"], cache_folder=cache_folder)))
             
         elif dim_red_algo == DimReduction.LDA.value:
             n_comp = len(model_classes) - 1
             estimators.append(("reducer", LDA(n_components=n_comp)))
             
-        # 3. Add model
+        # 4. Add model
         if ml_algo == ModelType.NAIVE_BAYES.value:
             model_params.pop("random_state", None)
             estimators.append(("binarizer", Binarizer()))
@@ -297,18 +523,96 @@ class MLEngine:
             estimators.append(("model", LogisticRegression(**model_params)))
         
         elif ml_algo == ModelType.SVM.value:
-            estimators.append(("model", SVC(**model_params)))
+            if pipeline_setup["kernel_approx"]:
+                # Approximate kernel map plus a linear SVM (near-linear time, same C/kernel/gamma params)
+                estimators.append(("model", ApproxKernelSVC(approx=pipeline_setup["kernel_approx"], n_components=pipeline_setup["kernel_approx_comp"], **model_params)))
+            else:
+                estimators.append(("model", SVC(**model_params)))
         
         elif ml_algo == ModelType.GRADIENT_BOOSTING.value:
-            estimators.append(("model", LGBMClassifier(**model_params)))    
+            if booster_setup is not None and booster_setup["native"]:
+                cache_folder = self.cache_folder + "lightgbm/" if booster_setup["binary_cache"] and self.cache_folder else ""
+                estimators.append(("model", BoosterClassifier(early_stopping_rounds=booster_setup["early_stopping_rounds"], valid_size=booster_setup["valid_size"],
+                                                              cache_folder=cache_folder, cache_size_mb=booster_setup["binary_cache_mb"], n_jobs=n_threads, **model_params)))
+            else:
+                estimators.append(("model", LGBMClassifier(n_jobs=n_threads, **model_params)))
         
-        # Create model pipeline
-        pipe = Pipeline(estimators)
+        # Create model pipeline (fitted transformers are cached in memory, if given)
+        pipe = Pipeline(estimators, memory=memory)
         self.logger.log_info(str(pipe))
         
         # Return model and model params
         return pipe
     
+    # Core function - Return the disk-backed cache of fitted pipeline transformers (None if disabled)
+    def __get_pipeline_memory(self, cache_setup:dict) -> jl.Memory:
+        memory = None
+        
+        if cache_setup["folder"]:
+            memory = jl.Memory(location=cache_setup["folder"], verbose=0)
+        
+        return memory
+    
+    # Core function - Log the columns kept by the feature selector of a fitted model (and the fit time of the next steps with and without it)
+    def __log_feature_selection(self, clf:Pipeline, X, y:np.ndarray, report:bool=False):
+        
+        if "selector" in clf.named_steps:
+            steps = [name for name, step in clf.steps]
+            ix = steps.index("selector")
+            support = clf.named_steps["selector"].get_support()
+            self.logger.log_info("- Feature selection: %s of %s columns kept" % (support.sum(), len(support)))
+            
+            # The steps after the selector are fitted again (clones) on the selected and on all the columns
+            if report:
+                X = clf[:ix].transform(X) if ix > 0 else X
+                fit_times = []
+                for X_fit in [clf.named_steps["selector"].transform(X), X]:
+                    start_time = time.time()
+                    clone(clf[ix + 1:]).fit(X_fit, y)
+                    fit_times.append(time.time() - start_time)
+                
+                saving = 100.0 * (1.0 - fit_times[0] / fit_times[1]) if fit_times[1] > 0 else 0.0
+                self.logger.log_info("- Feature selection: fit time %0.3f seconds with the selector, %0.3f seconds without it (saving: %0.2f%%)" % (*fit_times, saving))
+    
+    # Core function - Log the explained variance of the dim reducer of a fitted model
+    def __log_dim_reduction(self, clf:Pipeline):
+        
+        if "reducer" in clf.named_steps and hasattr(clf.named_steps["reducer"], "explained_variance_ratio_"):
+            variance = clf.named_steps["reducer"].explained_variance_ratio_
+            self.logger.log_info("- Dim reduction: %s components, explained variance: %0.4f" % (len(variance), variance.sum()))
+    
+    # Core function - Warm-start a trained model with the test rows (fitted transformers are kept), return False if not supported
+    def __warm_start_model(self, clf:Pipeline, X, y:np.ndarray, X_test, y_test:np.ndarray, n_rounds:int) -> bool:
+        result = True
+        model = clf.steps[-1][1]
+        transformer = clf[:-1] if len(clf.steps) > 1 else None
+        
+        # Transform all the rows with the transformers fitted on the train rows
+        if transformer is not None:
+            X, X_test = transformer.transform(X), transformer.transform(X_test)
+        
+        # Class counts are additive, the test rows are just added
+        if isinstance(model, MultinomialNB):
+            model.partial_fit(X_test, y_test)
+        
+        # Solver starts from the trained coefficients
+        elif isinstance(model, LogisticRegression) and model.solver != "liblinear":
+            model.set_params(warm_start=True).fit(X, y)
+        
+        # Boosting continues from the trained trees (n_rounds more trees)
+        elif isinstance(model, LGBMClassifier):
+            booster = model.booster_
+            model.set_params(n_estimators=n_rounds).fit(X, y, init_model=booster)
+        
+        elif isinstance(model, BoosterClassifier):
+            booster = model.booster_
+            model.set_params(n_estimators=n_rounds).fit(X, y, init_model=booster)
+        
+        else:
+            result = False
+        
+        return result
+    
     # Core function - Calculate model errors
     def __calculate_model_errors(self, y_real:list, y_pred:list, model_classes:list) -> tuple:
         results = mlu.calculate_errors(self.task_type, y_real, y_pred, model_classes)
@@ -364,6 +668,9 @@ class MLEngine:
             elif self.task_type == TaskType.REL_CLASSIFICATION.value:
                 params = {"learning_rate": 0.1, "n_estimators": 150, "max_depth": 5, "min_samples_leaf": 1, "random_state": model_state}
         
+        # Tuned params (e.g. written by the model optimizer) override the default ones
+        params.update(self.get_tuned_params(ml_algo))
+        
         self.logger.log_info(params)
         return params
     
@@ -403,57 +710,103 @@ class MLEngine:
     ### ML PUBLIC FUNCTIONS ###
     ###########################
     
-    # ML function - Create dataset
-    def create_dataset(self, data_path:str, y_label:str, force_create_dataset:bool, feat_setup:dict) -> tuple:
+    # ML function - Create the task-agnostic feature dataset (shared by all tasks) and the label records
+    def create_shared_dataset(self, data_path:str, force_create_dataset:bool, feat_setup:dict) -> tuple:
+        dataset = None
+        labels = self.__read_label_file(data_path)
+        
+        # Dataset cache key (feature setup, language and input files)
+        ds_cache = DatasetCache(data_path + "cache/", self.logger)
+        self.cache_folder = ds_cache.cache_folder
+        ds_setup = {"features": feat_setup, "language": self.language}
+        ds_key = ds_cache.get_key(ds_setup, self.__get_input_files(data_path))
+        
+        # Read it from cache
+        if not force_create_dataset:
+            dataset = ds_cache.load_dataset(ds_key)
+        
+        # Create it (rows are identified by the proposition id) and save it to disk
+        if dataset is None:
+            dataset = self.__create_dataset(data_path, labels, "id", feat_setup, ds_cache, force_create_dataset)
+            
+            if dataset is not None:
+                ds_cache.save_dataset(ds_key, dataset, ds_setup)
+        
+        return dataset, labels
+    
+    # ML function - Create dataset (from the shared feature dataset and label records, if given)
+    def create_dataset(self, data_path:str, y_label:str, force_create_dataset:bool, feat_setup:dict, sparse_dataset:bool=False, shared_data:tuple=None) -> tuple:
         dataset = None
         label_dict = {}
-        df_filepath = data_path + "dataset.csv"
         
-        if force_create_dataset or not os.path.exists(df_filepath):
+        # Dataset cache key (feature setup, language, task and input files)
+        ds_cache = DatasetCache(data_path + "cache/", self.logger)
+        self.cache_folder = ds_cache.cache_folder
+        ds_setup = {"features": feat_setup, "language": self.language, "task": self.task_type, "y_label": y_label}
+        ds_key = ds_cache.get_key(ds_setup, self.__get_input_files(data_path))
+        
+        # Take it from the shared feature dataset or read it from cache
+        if shared_data is not None and shared_data[0] is not None:
+            dataset = self.__create_task_dataset(*shared_data, y_label)
+        
+        elif not force_create_dataset:
+            dataset = ds_cache.load_dataset(ds_key)
+        
+        if dataset is None:
             
             # Creation of initial dataset
-            features = self.__read_feature_file(data_path)
             labels = self.__read_label_file(data_path)
-            stopwords = self.__read_stopword_list(data_path)
-            dataset = self.__create_dataset(features, labels, y_label, feat_setup, stopwords)
+            dataset = self.__create_dataset(data_path, labels, y_label, feat_setup, ds_cache, force_create_dataset)
             
             # If is task3 then apply filter and data augmentation
-            if self.task_type == TaskType.REL_CLASSIFICATION.value:
+            if dataset is not None and self.task_type == TaskType.REL_CLASSIFICATION.value:
                 dataset = self.__data_augmentation(dataset, labels)
             
             # Save it to disk
             if dataset is not None:
-                dataset.to_csv(df_filepath, index=False)
-        else:
-            # Or, read it from disk
-            dataset = ufl.get_df_from_csv(df_filepath)
+                ds_cache.save_dataset(ds_key, dataset, ds_setup)
+        
+        # Frozen featurizer of the dataset column space (saved with the final model)
+        if dataset is not None:
+            stopwords = self.__read_stopword_list(data_path) if feat_setup["remove_stopwords"] else set()
+            self.featurizer = Featurizer(self.language, feat_setup, dataset.columns, dataset.blocks, stopwords, self.stem_setup["max_size"], feat_setup["hash_bits"])
+        
+        # Keep it sparse or convert it to a dense dataframe
+        if dataset is not None and not sparse_dataset:
+            dataset = dataset.to_dataframe(self.label_column)
         
         # Final formatting
         if dataset is not None:
-            label_dict, label_list = mlu.get_label_dict(self.task_type, dataset[self.label_column].tolist())
-            dataset[self.label_column] = label_list
+            if isinstance(dataset, SparseDataset):
+                label_dict, label_list = mlu.get_label_dict(self.task_type, dataset.y.tolist())
+                dataset.y = np.array(label_list)
+                ds_sparsity = dataset.get_sparsity()
+                df_labels = pd.DataFrame({self.label_column: dataset.y})
+            else:
+                label_dict, label_list = mlu.get_label_dict(self.task_type, dataset[self.label_column].tolist())
+                dataset[self.label_column] = label_list
+                ds_sparsity = uml.calc_df_sparsity(dataset)
+                df_labels = dataset
             
             # Calculate dataset sparsity
-            ds_sparsity = uml.calc_df_sparsity(dataset)
             self.logger.log_info("- Original dataset sparsity: " + str(ds_sparsity))
             
             # Show dataset labels info
             self.logger.log_info("- Dataset labels info:")
             self.logger.log_info(str(label_dict))
-            self.logger.log_info(str(mlu.get_df_col_stats(dataset, self.label_column)))
+            self.logger.log_info(str(mlu.get_df_col_stats(df_labels, self.label_column)))
             self.logger.log_info("\n" + str(dataset))
         
         return dataset, label_dict
     
     # ML function - Split dataset into train/test
-    def split_dataset(self, dataset:pd.DataFrame, train_setup:dict) -> tuple:
+    def split_dataset(self, dataset, train_setup:dict) -> tuple:
         cv_stratified = train_setup["cv_stratified"]
         perc_test = train_setup["perc_test"]
         model_state = train_setup["model_state"]
         
         # Features (X) and labels (y)
-        X = dataset.drop(self.label_column, axis=1).values
-        y = dataset[self.label_column].values
+        X, y = self.get_features_and_labels(dataset)
         
         if cv_stratified:
             sss = StratifiedShuffleSplit(n_splits=1, test_size=perc_test, random_state=model_state)
@@ -468,18 +821,23 @@ class MLEngine:
         return X_train, X_test, y_train, y_test
     
     # ML function - Create and train model
-    def create_and_train_model(self, pipeline_setup:dict, X_train:np.ndarray, y_train:np.ndarray, model_classes, model_state:int) -> tuple:
+    def create_and_train_model(self, pipeline_setup:dict, X_train:np.ndarray, y_train:np.ndarray, model_classes, model_state:int, train_setup:dict=None) -> tuple:
         ml_algo = pipeline_setup["ml_algo"]
         
         # Create model pipeline
         self.logger.log_info("- Creating model: " + ml_algo)
         
         params = self.__get_model_params(ml_algo, model_state)
-        clf = self.__create_model(pipeline_setup, params, model_classes)
+        booster_setup = train_setup["booster"] if train_setup is not None else None
+        clf = self.__create_model(pipeline_setup, params, model_classes, self.parallel_setup["cores"], booster_setup=booster_setup, model_state=model_state)
         
-        # Train model with train data
+        # Train model with train data (using all the cores of the scenario)
         self.logger.log_info("- Training model: " + ml_algo)
-        clf.fit(X_train, y_train)
+        self.logger.log_info("- Parallel setup: " + str({"threads": self.parallel_setup["cores"]}))
+        with threadpool_limits(limits=self.parallel_setup["cores"]):
+            clf.fit(X_train, y_train)
+            self.__log_feature_selection(clf, X_train, y_train, pipeline_setup["feat_sel_report"])
+            self.__log_dim_reduction(clf)
         
         # Return model and model params
         return clf, params
@@ -491,21 +849,43 @@ class MLEngine:
         # Create model pipeline
         self.logger.log_info("- Creating model: " + ml_algo)
         params = {"random_state": model_state}
-        clf = self.__create_model(pipeline_setup, params, model_classes)
+        cache_setup = train_setup["pipeline_cache"]
+        memory = self.__get_pipeline_memory(cache_setup)
+        clf = self.__create_model(pipeline_setup, params, model_classes, self.parallel_setup["inner_threads"], memory, train_setup["booster"], model_state)
         scores = ()
         
         # Fit model with train data
         self.logger.log_info("- Fitting model: " + ml_algo)
+        self.logger.log_info("- Parallel setup: " + str(self.parallel_setup))
+        outer_jobs = self.parallel_setup["outer_jobs"]
         cv_k = train_setup["cv_k"]
         space = self.__get_model_param_space(ml_algo)        
             
-        # Model tuning
-        tuning = GridSearchCV(estimator=clf, param_grid=space, scoring=self.opt_metric, cv=cv_k, n_jobs=8, refit=True)
-        tuning.fit(X_train, y_train)
+        # Model tuning: exhaustive grid search, or a budget-aware (anytime) search that keeps the best candidate so far
+        hp_search = train_setup["hp_search"]
+        strategy = hp_search["strategy"]
         
-        # Keep the best
-        clf = tuning.best_estimator_
+        if strategy == SearchStrategy.GRID.value and not hp_search["max_fits"] and not hp_search["max_time"]:
+            tuning = GridSearchCV(estimator=clf, param_grid=space, scoring=self.opt_metric, cv=cv_k, n_jobs=outer_jobs, refit=True)
+            with self.__get_parallel_context():
+                tuning.fit(X_train, y_train)
+            self.search_info = {"strategy": strategy, "n_candidates": len(tuning.cv_results_["params"]), "n_fits": len(tuning.cv_results_["params"]) * cv_k, "exhausted": False}
+        else:
+            tuning = BudgetSearch(clf, space, strategy, self.opt_metric, cv_k, n_jobs=outer_jobs, max_fits=hp_search["max_fits"], max_time=hp_search["max_time"],
+                                  factor=hp_search["factor"], max_candidates=hp_search["max_candidates"], random_state=model_state, logger=self.logger)
+            with self.__get_parallel_context():
+                tuning.fit(X_train, y_train)
+            self.search_info = tuning.get_info()
+        self.logger.log_info("- Search: " + str(self.search_info))
+        
+        # Keep the best (without the transformer cache), and evict the least recently used cached transformers
+        clf = tuning.best_estimator_.set_params(memory=None)
         params = tuning.best_params_
+        self.__log_feature_selection(clf, X_train, y_train)
+        self.__log_dim_reduction(clf)
+        if memory is not None:
+            memory.reduce_size(bytes_limit=str(cache_setup["max_size_mb"]) + "M")
+            self.logger.log_info("- Pipeline cache: " + cache_setup["folder"])
         scores = tuning.cv_results_["mean_test_score"][0], tuning.cv_results_["std_test_score"][0]
         
         # Verbose
@@ -528,26 +908,278 @@ class MLEngine:
         # Calculate and return error metrics
         return self.__calculate_model_errors(y_test, y_test_pred, model_classes)
     
+    # ML function - Return the errors of a pipeline setup (invalid step combinations are rejected before any fit)
+    def check_pipeline_setup(self, pipeline_setup:dict, sparse_dataset:bool=False, streaming:bool=False) -> list:
+        errors = []
+        
+        # Streaming mode: featurized chunks are always sparse, and only scalers and models with partial_fit are supported
+        if streaming:
+            sparse_dataset = True
+            if pipeline_setup["ml_algo"] not in [ModelType.NAIVE_BAYES.value, ModelType.LOG_REG.value, ModelType.SVM.value]:
+                errors.append("The '" + pipeline_setup["ml_algo"] + "' model has no incremental training, use 'naive-bayes', 'logistic-regression' or 'support-vector-machine' in streaming mode")
+            for step in ["feat_sel_algo", "dim_red_algo", "kernel_approx"]:
+                if pipeline_setup[step]:
+                    errors.append("The '" + pipeline_setup[step] + "' step (" + step + ") is not supported in streaming mode")
+        
+        # Sparse CSR input: MinMaxScaler and LDA need dense data, and a centering StandardScaler would densify it
+        if sparse_dataset and pipeline_setup["data_scale_algo"] in [ScaleData.NORMALIZE.value, ScaleData.STANDARDIZE.value]:
+            errors.append("The '" + pipeline_setup["data_scale_algo"] + "' scaler does not support sparse datasets, use 'max-abs' or 'unit-variance' instead (or sparse_dataset: false)")
+        if sparse_dataset and pipeline_setup["dim_red_algo"] == DimReduction.LDA.value:
+            errors.append("The 'lda' reducer does not support sparse datasets, use 'svd' or 'incremental-pca' instead (or sparse_dataset: false)")
+        
+        # chi2 scores need non-negative data
+        if pipeline_setup["feat_sel_algo"] == FeatureSelection.CHI2.value and pipeline_setup["data_scale_algo"] == ScaleData.STANDARDIZE.value:
+            errors.append("The chi2 feature selector needs non-negative data, it cannot follow the '" + pipeline_setup["data_scale_algo"] + "' scaler")
+        
+        # Each incremental PCA batch needs at least as many rows as components
+        if pipeline_setup["dim_red_algo"] == DimReduction.IPCA.value and pipeline_setup["dim_red_batch"] < pipeline_setup["dim_red_comp"]:
+            errors.append("The incremental-pca reducer needs a batch size (dim_red_batch) not lower than its components (dim_red_comp)")
+        
+        # Kernel approximations are only defined for the SVM
+        if pipeline_setup["kernel_approx"] and pipeline_setup["ml_algo"] != ModelType.SVM.value:
+            errors.append("The '" + pipeline_setup["kernel_approx"] + "' kernel approximation is only available for the support-vector-machine model")
+        
+        return errors
+    
+    # ML function - Create the streaming dataset: featurizer, label vector (by feature record) and train/test rows, nothing is featurized
+    def create_stream_dataset(self, data_path:str, y_label:str, feat_setup:dict, train_setup:dict) -> tuple:
+        labels = self.__read_label_file(data_path)
+        
+        # If is task3 then the spam records are filtered
+        if self.task_type == TaskType.REL_CLASSIFICATION.value:
+            labels = [label for label in labels if label["sent_label2"].lower() != "spam"]
+        
+        label_dict, label_list = mlu.get_label_dict(self.task_type, [label_data[y_label].lower() for label_data in labels])
+        rows = np.array([label["ix"] for label in labels], dtype=int)
+        n_rows = rows.max() + 1 if len(rows) else 0
+        y = np.full(n_rows, -1)
+        y[rows] = label_list
+        
+        # Same train/test split of split_dataset (it only depends on the labels)
+        positions = np.arange(len(rows))
+        if train_setup["cv_stratified"]:
+            sss = StratifiedShuffleSplit(n_splits=1, test_size=train_setup["perc_test"], random_state=train_setup["model_state"])
+            train_index, test_index = next(sss.split(positions, y[rows]))
+        else:
+            train_index, test_index = train_test_split(positions, test_size=train_setup["perc_test"], random_state=train_setup["model_state"])
+        
+        # Frozen featurizer of the column space (saved with the final model)
+        self.featurizer = self.__create_stream_featurizer(data_path, feat_setup)
+        
+        stream_data = {"data_path": data_path, "y": y, "n_rows": n_rows, "rows": rows, "train_rows": np.sort(rows[train_index]), "test_rows": np.sort(rows[test_index])}
+        self.logger.log_info("- Streaming dataset: " + str(len(rows)) + " records (" + str(len(train_index)) + " train, " + str(len(test_index)) + " test)")
+        self.logger.log_info("- Dataset labels info:")
+        self.logger.log_info(str(label_dict))
+        
+        return stream_data, label_dict
+    
+    # ML function - Create and train a model incrementally over chunks of feature records (or continue training clf)
+    def create_and_train_stream_model(self, pipeline_setup:dict, stream_data:dict, rows:np.ndarray, model_classes, model_state:int, stream_setup:dict, clf:Pipeline=None) -> tuple:
+        ml_algo = pipeline_setup["ml_algo"]
+        params = self.__get_model_params(ml_algo, model_state)
+        chunk_args = (stream_data["data_path"], rows, stream_data["n_rows"], stream_setup["chunk_size"])
+        
+        # Create model pipeline, the scaler is fitted first (one pass)
+        if clf is None:
+            self.logger.log_info("- Creating model: " + ml_algo)
+            clf = self.__create_stream_model(pipeline_setup, dict(params), len(rows), model_state)
+            
+            if clf is not None and "scaler" in clf.named_steps:
+                for chunk_rows, features in self.__read_feature_chunks(*chunk_args):
+                    clf.named_steps["scaler"].partial_fit(self.featurizer.transform(features))
+        
+        if clf is None:
+            return None, params
+        
+        # Train model chunk by chunk (records are shuffled within each chunk)
+        self.logger.log_info("- Training model: " + ml_algo)
+        transformer = clf[:-1] if len(clf.steps) > 1 else None
+        model = clf.steps[-1][1]
+        classes = np.arange(len(model_classes))
+        rng = np.random.RandomState(model_state)
+        
+        for epoch in range(stream_setup["n_epochs"]):
+            n_records = 0
+            for chunk_rows, features in self.__read_feature_chunks(*chunk_args):
+                X = self.featurizer.transform(features)
+                if transformer is not None:
+                    X = transformer.transform(X)
+                
+                order = rng.permutation(len(chunk_rows))
+                model.partial_fit(X[order], stream_data["y"][chunk_rows][order], classes=classes)
+                n_records += len(chunk_rows)
+            
+            self.logger.log_info("- Epoch " + str(epoch + 1) + ": " + str(n_records) + " records")
+        
+        # Report and save stem cache
+        stemmer = self.featurizer.get_stemmer()
+        stemmer.log_stats(self.logger)
+        stemmer.save()
+        
+        # Return model and its effective params
+        return clf, self.__get_stream_model_params(clf)
+    
+    # ML function - Test a streaming model (predictions are made chunk by chunk)
+    def test_stream_model(self, clf, stream_data:dict, model_classes:list, stream_setup:dict) -> tuple:
+        self.logger.log_info("- Testing model:")
+        y_test = []
+        y_test_pred = []
+        
+        for chunk_rows, features in self.__read_feature_chunks(stream_data["data_path"], stream_data["test_rows"], stream_data["n_rows"], stream_setup["chunk_size"]):
+            y_test.append(stream_data["y"][chunk_rows])
+            y_test_pred.append(clf.predict(self.featurizer.transform(features)))
+        
+        y_test = np.concatenate(y_test)
+        y_test_pred = np.concatenate(y_test_pred)
+        
+        # Calculate mislabeled records
+        self.mislabeled_records = mlu.calc_mislabeled_records(y_test, y_test_pred)
+        
+        # Calculate and return error metrics
+        return self.__calculate_model_errors(y_test, y_test_pred, model_classes)
+    
     # ML function - Get ids of mislabeled records
     def get_mislabeled_records(self) -> dict:
         return self.mislabeled_records
     
-    # ML function - Creates and save final model
-    def create_and_save_model(self, filepath:str, dataset:pd.DataFrame, pipeline_setup:dict, model_classes, model_state:int):
+    # ML function - Get the summary of the last hyperparameter search (strategy, candidates, fits and budget)
+    def get_search_info(self) -> dict:
+        return self.search_info
+    
+    # ML function - Creates and save final model (with its featurizer)
+    def create_and_save_model(self, filepath:str, dataset, pipeline_setup:dict, model_classes, model_state:int, train_setup:dict=None):
+        
+        # Create final model
+        clf = self.create_final_model(dataset, pipeline_setup, model_classes, model_state, train_setup)
+        
+        # Model persistence
+        if not self.save_model(filepath, clf, isinstance(dataset, SparseDataset), model_classes):
+            clf = None
+        
+        return clf
+    
+    # ML function - Creates final model: refit with the whole dataset, reuse the trained (or tuned) model, or warm-start it with the test rows
+    def create_final_model(self, dataset, pipeline_setup:dict, model_classes, model_state:int, train_setup:dict=None, clf:Pipeline=None):
+        final_mode = train_setup["final_model"]["mode"] if train_setup is not None and clf is not None else FinalModel.REFIT.value
+        
+        # Save the trained model as it is
+        if final_mode == FinalModel.REUSE.value:
+            self.logger.log_info("- Final model: trained model reused")
+            return clf
         
         # Features (X) and labels (y)
-        X = dataset.drop(self.label_column, axis=1).values
-        y = dataset[self.label_column].values
+        X, y = self.get_features_and_labels(dataset)
+        
+        # Continue training the model with the test rows (if the algorithm supports it)
+        if final_mode == FinalModel.WARM_START.value:
+            X_train, X_test, y_train, y_test = self.split_dataset(dataset, train_setup)
+            if self.__warm_start_model(clf, X, y, X_test, y_test, train_setup["final_model"]["warm_start_rounds"]):
+                self.logger.log_info("- Final model: trained model warm-started with the test rows")
+                return clf
         
         # Create final model
-        clf, params = self.create_and_train_model(pipeline_setup, X, y, model_classes, model_state)
+        clf, params = self.create_and_train_model(pipeline_setup, X, y, model_classes, model_state, train_setup)
+        
+        return clf
+    
+    # ML function - Save a model (with its featurizer and model setup)
+    def save_model(self, filepath:str, clf, sparse_dataset:bool, model_classes) -> bool:
         
         # Model persistence
         jl.dump(clf, filepath) 
-        if not os.path.exists(filepath):
-            clf = None
+        result = os.path.exists(filepath)
         
-        return clf
+        # Featurizer and model setup persistence (used to make predictions from raw feature records)
+        if result and self.featurizer is not None:
+            model_setup = {"task": self.task_type, "language": self.language, "features": self.featurizer.feat_setup,
+                           "sparse_dataset": sparse_dataset, "model_classes": list(model_classes)}
+            self.featurizer.save(self.__get_featurizer_filepath(filepath))
+            ufl.save_dict_to_json(self.__get_model_setup_filepath(filepath), model_setup)
+        
+        return result
+    
+    # ML function - Load a saved model (and its featurizer) to make predictions
+    def load_model(self, filepath:str) -> bool:
+        result = False
+        model_setup = ufl.get_dict_from_json(self.__get_model_setup_filepath(filepath))
+        featurizer = Featurizer.load(self.__get_featurizer_filepath(filepath))
+        
+        if os.path.exists(filepath) and len(model_setup) and featurizer is not None:
+            self.model = jl.load(filepath)
+            self.model_setup = model_setup
+            self.featurizer = featurizer
+            self.logger.log_info("- Model loaded: " + filepath)
+            result = True
+        
+        return result
+    
+    # ML function - Transform a batch of raw feature records (features.json schema) into the model input matrix
+    def transform(self, features:list):
+        X = self.featurizer.transform(features)
+        if not self.model_setup["sparse_dataset"]:
+            X = X.toarray()
+        return X
+    
+    # ML function - Make predictions (labels or probabilities) for a batch of raw feature records (features.json schema)
+    def predict(self, features:list, proba:bool=False) -> np.ndarray:
+        return self.predict_matrix(self.transform(features), proba)
+    
+    # ML function - Make predictions (labels or probabilities) for a transformed model input matrix
+    def predict_matrix(self, X, proba:bool=False) -> np.ndarray:
+        if proba:
+            y_pred = self.model.predict_proba(X)
+        else:
+            y_pred = np.array(self.model_setup["model_classes"])[self.model.predict(X)]
+        
+        return y_pred
+    
+    # ML function - Set the column index of the next model pipelines (None: all the dataset columns)
+    def set_column_index(self, column_index:np.ndarray):
+        self.column_index = column_index
+    
+    # ML function - Returns the features (X) and labels (y) of a dense (DataFrame) or sparse dataset
+    def get_features_and_labels(self, dataset) -> tuple:
+        
+        if isinstance(dataset, SparseDataset):
+            X = dataset.X
+            y = dataset.y
+        else:
+            X = dataset.drop(self.label_column, axis=1).values
+            y = dataset[self.label_column].values
+        
+        return X, y
+    
+    # ML function - Returns the tuned params of an algorithm for the current task (empty if it was not tuned)
+    def get_tuned_params(self, ml_algo:str) -> dict:
+        tuned_params = {}
+        
+        if os.path.exists(self.params_filepath):
+            tuned_params = ufl.get_dict_from_json(self.params_filepath)
+        
+        return tuned_params.get(ml_algo, {}).get(self.task_type, {})
+    
+    # ML function - Save the tuned params of an algorithm for the current task (used by __get_model_params)
+    def save_tuned_params(self, ml_algo:str, params:dict) -> bool:
+        tuned_params = {}
+        
+        if os.path.exists(self.params_filepath):
+            tuned_params = ufl.get_dict_from_json(self.params_filepath)
+        
+        tuned_params.setdefault(ml_algo, {})[self.task_type] = params
+        result = ufl.save_dict_to_json(self.params_filepath, tuned_params)
+        
+        return result
+    
+    # ML function - Return the content hash of an evaluation scenario: task, feature/pipeline/train setups, tuned params and input data fingerprint
+    def get_scenario_key(self, data_path:str, feat_setup:dict, pipeline_setup:dict, train_setup:dict, run_mode:str=RunMode.APP.value) -> str:
+        ds_cache = DatasetCache(data_path + "cache/", self.logger)
+        
+        # The cache folder and the final model mode do not change the evaluation results, the run mode tells if a final model was saved
+        train_setup = {k: v for k, v in train_setup.items() if k not in ["pipeline_cache", "final_model"]}
+        setup = {"task": self.task_type, "language": self.language, "features": feat_setup, "pipeline": pipeline_setup, "train": train_setup,
+                 "params": self.get_tuned_params(pipeline_setup["ml_algo"]), "mode": run_mode}
+        
+        return ds_cache.get_key(setup, self.__get_input_files(data_path))
     
     # ML function - Returns the next model id (current + 1)
     def get_next_model_id(self, filepath:str) -> int:
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""
+    Created by: Andrés Segura-Tinoco
+    Version: 0.4.0
+    Created on: Oct 18, 2026
+    Updated on: Oct 18, 2026
+    Description: Frozen featurizer of the ML engine (maps feature records to a fixed column space).
+"""
+
+# Import Custom libraries
+import ml.utility as mlu
+import ml.stemmer as mls
+from ml.constant import FeatureBlock, VOCABULARY_BLOCKS, NUMERIC_COLUMNS
+
+# Import Python base libraries
+import os
+import numpy as np
+import scipy.sparse as sp
+import joblib as jl
+from array import array
+from collections import Counter
+from sklearn.utils import murmurhash3_32
+
+######################
+### UTIL FUNCTIONS ###
+######################
+
+# Util function - Get the values of a feature block from a feature record
+def get_block_values(block:str, v:dict, set_stopwords:set, stemmer:mls.CachedStemmer) -> list:
+    values = []
+    
+    # Vocabulary - BoW and PoS: transform words to lower case and remove stopwords (step -0)
+    if block in VOCABULARY_BLOCKS:
+        values = [ele.lower() for ele in v[block]]
+        if set_stopwords:
+            values = [ele for ele in values if ele not in set_stopwords]
+    
+    # Entities matrix
+    elif block == FeatureBlock.ENTITIES.value:
+        values = mlu.value_to_features(v["entities"], "ent")
+    
+    # Adverbs matrix
+    elif block == FeatureBlock.ADVERBS.value:
+        tokens = [stemmer.stem(ele) for ele in v["adverbs"]]
+        values = mlu.value_to_features(tokens, "avb")
+    
+    # Verbs matrix
+    elif block == FeatureBlock.VERBS.value:
+        tokens = [stemmer.stem(ele) for ele in v["verbs"]]
+        values = mlu.value_to_features(tokens, "vb")
+    
+    # Nouns matrix
+    elif block == FeatureBlock.NOUNS.value:
+        values = mlu.value_to_features(v["nouns"], "nns")
+    
+    # Punctuation matrix
+    elif block == FeatureBlock.PUNCTUATION.value:
+        values = mlu.value_to_features(v["punctuation"], "pm")
+    
+    # Keyword matrix (step -8)
+    elif block == FeatureBlock.KEY_WORDS.value:
+        values = mlu.value_to_features(v["key_words"], "kw")
+    
+    # Structural features
+    elif block == FeatureBlock.STRUC_STATS.value:
+        values = [len(v["modal_auxs"]), v["text_length"], v["text_position"], v["token_count"], v["avg_word_length"], v["punct_marks_count"]]
+    
+    # Syntactic features
+    elif block == FeatureBlock.SYNT_STATS.value:
+        values = [v["parse_tree_depth"], v["sub_clauses_count"]]
+    
+    return values
+
+# Util function - Return the column of a token in the hashed space of a feature block (each block is a separate namespace)
+def hash_token(block:str, token:str, hash_bits:int) -> int:
+    return murmurhash3_32(block + ":" + token, positive=True) & ((1 << hash_bits) - 1)
+
+# Util function - Transform a chunk of feature records in a worker process with a copy of the shared stemmer (returns the matrix and the stem cache updates)
+def transform_chunk(featurizer, features:list, stemmer:mls.CachedStemmer) -> tuple:
+    hits, misses = stemmer.hits, stemmer.misses
+    X = featurizer.transform(features, stemmer)
+    return X, stemmer.get_updates(hits, misses)
+
+########################
+### FEATURIZER CLASS ###
+########################
+
+# Frozen featurizer class (per-block vocabularies or hashed spaces, stopwords, stemmer settings and numeric column order)
+class Featurizer:
+    
+    # Constructor (with hash_bits > 0, token blocks are hashed into 2^hash_bits columns each and columns can be None)
+    def __init__(self, language:str, feat_setup:dict, columns:list, blocks:dict, stopwords:set, stem_max_size:int=100000, hash_bits:int=0):
+        self.language = language
+        self.feat_setup = dict(feat_setup)
+        self.n_columns = max([end for start, end in blocks.values()], default=0)
+        self.blocks = dict(blocks)
+        self.stopwords = set(stopwords) if feat_setup["remove_stopwords"] else set()
+        self.stem_max_size = stem_max_size
+        self.hash_bits = hash_bits
+        self.stemmer = None
+        
+        # Token to column index maps (token blocks) and ordered columns (numeric blocks)
+        self.vocabularies = {}
+        self.numeric_columns = {}
+        for block, (start, end) in self.blocks.items():
+            if block in NUMERIC_COLUMNS:
+                self.numeric_columns[block] = columns[start:end] if columns is not None else list(NUMERIC_COLUMNS[block])
+            elif not hash_bits:
+                self.vocabularies[block] = {columns[ix]: ix for ix in range(start, end)}
+    
+    # The stemmer is not persisted, only its settings
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["stemmer"] = None
+        return state
+    
+    # Featurizers saved before the hashed spaces use vocabularies only
+    def __setstate__(self, state:dict):
+        state.setdefault("hash_bits", 0)
+        self.__dict__.update(state)
+    
+    # Return the (shared) memoized stemmer
+    def get_stemmer(self) -> mls.CachedStemmer:
+        if self.stemmer is None:
+            self.stemmer = mls.get_stemmer(self.language, self.stem_max_size)
+        return self.stemmer
+    
+    # Transform a batch of feature records into one CSR matrix (unknown tokens are dropped), with the given stemmer or its own
+    def transform(self, features:list, stemmer:mls.CachedStemmer=None) -> sp.csr_matrix:
+        stemmer = stemmer if stemmer is not None else self.get_stemmer()
+        indices = array("i")
+        data = array("d")
+        indptr = array("q", [0])
+        
+        for v in features:
+            for block, (start, end) in self.blocks.items():
+                values = get_block_values(block, v, self.stopwords, stemmer)
+                
+                # Token blocks only fill the known tokens, numeric blocks fill all their columns
+                if block in self.vocabularies:
+                    vocabulary = self.vocabularies[block]
+                    for token, count in Counter(values).items():
+                        ix = vocabulary.get(token)
+                        if ix is not None:
+                            indices.append(ix)
+                            data.append(count)
+                elif block in self.numeric_columns:
+                    indices.extend(range(start, end))
+                    data.extend(values)
+                else:
+                    for token, count in Counter(values).items():
+                        indices.append(start + hash_token(block, token, self.hash_bits))
+                        data.append(count)
+            
+            indptr.append(len(indices))
+        
+        X = sp.csr_matrix((np.frombuffer(data, dtype=np.float64), np.frombuffer(indices, dtype=np.int32), np.frombuffer(indptr, dtype=np.int64)),
+                          shape=(len(indptr) - 1, self.n_columns))
+        
+        # Hash collisions within a row are added up
+        if self.hash_bits:
+            X.sum_duplicates()
+        X.sort_indices()
+        
+        return X
+    
+    # Save the featurizer to disk
+    def save(self, filepath:str) -> bool:
+        jl.dump(self, filepath)
+        return os.path.exists(filepath)
+    
+    # Load a featurizer from disk
+    @staticmethod
+    def load(filepath:str):
+        featurizer = None
+        if os.path.exists(filepath):
+            featurizer = jl.load(filepath)
+        return featurizer
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+    Created by: Andrés Segura-Tinoco
+    Version: 0.1.0
+    Created on: Oct 18, 2026
+    Updated on: Oct 18, 2026
+    Description: Approximate-kernel SVM of the ML engine (explicit feature map followed by a linear SVM).
+"""
+
+# Import Custom libraries
+from ml.constant import KernelApprox
+
+# Import Python base libraries
+import numpy as np
+import scipy.sparse as sp
+
+# Import ML libraries
+from sklearn.base import BaseEstimator, ClassifierMixin
+from sklearn.kernel_approximation import Nystroem, RBFSampler
+from sklearn.svm import LinearSVC
+
+# Approximate-kernel SVM: the RBF kernel is replaced by a Nystroem or random Fourier feature map and the SVM is trained
+# in the primal (near-linear time in the number of rows). It takes the SVC params (C, kernel, gamma), so the SVM param
+# space and tuned params are still valid; the linear kernel is a plain linear SVM
+class ApproxKernelSVC(ClassifierMixin, BaseEstimator):
+    
+    # Constructor
+    def __init__(self, C:float=1.0, kernel:str="rbf", gamma="scale", approx:str=KernelApprox.NYSTROEM.value, n_components:int=500, max_iter:int=2000, random_state:int=None):
+        self.C = C
+        self.kernel = kernel
+        self.gamma = gamma
+        self.approx = approx
+        self.n_components = n_components
+        self.max_iter = max_iter
+        self.random_state = random_state
+    
+    # Util function - Return the numeric gamma (same 'scale' and 'auto' values as SVC)
+    def __get_gamma(self, X) -> float:
+        gamma = self.gamma
+        
+        if gamma == "scale":
+            X_var = X.multiply(X).mean() - X.mean() ** 2 if sp.issparse(X) else np.asarray(X).var()
+            gamma = 1.0 / (X.shape[1] * X_var) if X_var != 0 else 1.0
+        elif gamma == "auto":
+            gamma = 1.0 / X.shape[1]
+        
+        return gamma
+    
+    # Core function - Return the kernel feature map (None for the linear kernel)
+    def __create_feature_map(self, X):
+        feature_map = None
+        
+        if self.kernel == "rbf":
+            n_comp = min(self.n_components, X.shape[0]) if self.approx == KernelApprox.NYSTROEM.value else self.n_components
+            
+            if self.approx == KernelApprox.NYSTROEM.value:
+                feature_map = Nystroem(kernel="rbf", gamma=self.__get_gamma(X), n_components=n_comp, random_state=self.random_state)
+            elif self.approx == KernelApprox.RBF_SAMPLER.value:
+                feature_map = RBFSampler(gamma=self.__get_gamma(X), n_components=n_comp, random_state=self.random_state)
+            else:
+                raise ValueError("Unknown kernel approximation: " + str(self.approx))
+        
+        elif self.kernel != "linear":
+            raise ValueError("Kernel not supported by the approximate SVM: " + str(self.kernel))
+        
+        return feature_map
+    
+    # Util function - Map the rows to the kernel feature space
+    def __transform(self, X):
+        return self.feature_map_.transform(X) if self.feature_map_ is not None else X
+    
+    # ML function - Fit the feature map and the linear SVM
+    def fit(self, X, y):
+        self.feature_map_ = self.__create_feature_map(X)
+        
+        if self.feature_map_ is not None:
+            self.feature_map_.fit(X)
+        
+        self.svm_ = LinearSVC(C=self.C, max_iter=self.max_iter, random_state=self.random_state)
+        self.svm_.fit(self.__transform(X), y)
+        self.classes_ = self.svm_.classes_
+        self.n_features_in_ = X.shape[1]
+        
+        return self
+    
+    # ML function - Return the distance of the rows to the separating hyperplanes
+    def decision_function(self, X) -> np.ndarray:
+        return self.svm_.decision_function(self.__transform(X))
+    
+    # ML function - Predict classes
+    def predict(self, X) -> np.ndarray:
+        return self.svm_.predict(self.__transform(X))
@@ -1,9 +1,9 @@
 # -*- coding: utf-8 -*-
 """
     Created by: Andrés Segura-Tinoco
-    Version: 1.1.0
+    Version: 1.2.0
     Created on: Jun 28, 2022
-    Updated on: Mar 21, 2023
+    Updated on: Oct 18, 2026
     Description: Manages ML engine auditing
 """
 
@@ -22,17 +22,20 @@ class MLLog:
         self.logger = logging.getLogger("ml_logger")
         self.logger.setLevel(logging.DEBUG)
         
-        # Create file handler which logs even debug messages
-        fh = logging.FileHandler(self.log_path)
-        fh.setLevel(logging.DEBUG)
-        
-        # Create console handler with a higher log level
-        ch = logging.StreamHandler()
-        ch.setLevel(logging.ERROR)
-        
-        # Add the handlers to the logger
-        self.logger.addHandler(fh)
-        self.logger.addHandler(ch)
+        # Handlers are added only once per process (e.g. worker processes inherit them)
+        if not self.logger.handlers:
+            
+            # Create file handler which logs even debug messages
+            fh = logging.FileHandler(self.log_path)
+            fh.setLevel(logging.DEBUG)
+            
+            # Create console handler with a higher log level
+            ch = logging.StreamHandler()
+            ch.setLevel(logging.ERROR)
+            
+            # Add the handlers to the logger
+            self.logger.addHandler(fh)
+            self.logger.addHandler(ch)
         
         # Otherwise root logger prints things again
         self.logger.propagate = False
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+    Created by: Andrés Segura-Tinoco
+    Version: 0.1.0
+    Created on: Oct 18, 2026
+    Updated on: Oct 18, 2026
+    Description: Out-of-core dimensionality reduction of the ML engine (incremental PCA with a fitted components cache).
+"""
+
+# Import Python base libraries
+import os
+import hashlib
+import joblib
+import numpy as np
+import scipy.sparse as sp
+
+# Import ML libraries
+from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.decomposition import IncrementalPCA
+
+# Incremental PCA reducer: components are fitted batch by batch (only one dense row batch in memory), and the fitted
+# reducer is cached by the fingerprint of the fitted matrix, so runs with the same features and rows reuse it
+class IncrementalReducer(TransformerMixin, BaseEstimator):
+    
+    # Constructor
+    def __init__(self, n_components:int=100, batch_size:int=1000, cache_folder:str=""):
+        self.n_components = n_components
+        self.batch_size = batch_size
+        self.cache_folder = cache_folder
+    
+    # Util function - Return the hash key of a fitted matrix and the reducer params
+    def __get_key(self, X) -> str:
+        sha = hashlib.sha1(str((X.shape, self.n_components, self.batch_size)).encode("utf-8"))
+        
+        if sp.issparse(X):
+            X = X.tocsr()
+            for values in [X.data, X.indices, X.indptr]:
+                sha.update(np.ascontiguousarray(values).tobytes())
+        else:
+            sha.update(np.ascontiguousarray(X).tobytes())
+        
+        return sha.hexdigest()[:16]
+    
+    # Util function - Return the row batches (the last one is merged if it has fewer rows than components)
+    def __get_batches(self, n_rows:int, min_rows:int=0) -> list:
+        bounds = list(range(0, n_rows, self.batch_size)) + [n_rows]
+        
+        if len(bounds) > 2 and bounds[-1] - bounds[-2] < min_rows:
+            bounds.pop(-2)
+        
+        return list(zip(bounds[:-1], bounds[1:]))
+    
+    # Util function - Return a dense row batch
+    def __get_batch(self, X, start:int, end:int) -> np.ndarray:
+        batch = X[start:end]
+        return batch.toarray() if sp.issparse(batch) else np.asarray(batch, dtype=float)
+    
+    # Core function - Fit the incremental PCA batch by batch
+    def __fit_model(self, X) -> IncrementalPCA:
+        model = IncrementalPCA(n_components=self.n_components)
+        
+        for start, end in self.__get_batches(X.shape[0], self.n_components):
+            model.partial_fit(self.__get_batch(X, start, end))
+        
+        return model
+    
+    # ML function - Fit the reducer (loaded from the cache if the same matrix was already fitted)
+    def fit(self, X, y=None):
+        X = X.tocsr() if sp.issparse(X) else np.asarray(X)
+        filepath = ""
+        model = None
+        
+        if self.cache_folder:
+            if not os.path.exists(self.cache_folder):
+                os.makedirs(self.cache_folder, exist_ok=True)
+            filepath = self.cache_folder + "ipca-" + self.__get_key(X) + ".joblib"
+            
+            if os.path.exists(filepath):
+                model = joblib.load(filepath)
+        
+        if model is None:
+            model = self.__fit_model(X)
+            
+            # Written to a temporary file first (concurrent CV workers may fit the same fold)
+            if filepath:
+                joblib.dump(model, filepath + "." + str(os.getpid()) + ".tmp")
+                os.replace(filepath + "." + str(os.getpid()) + ".tmp", filepath)
+        
+        self.model_ = model
+        self.explained_variance_ratio_ = model.explained_variance_ratio_
+        self.n_features_in_ = X.shape[1]
+        
+        return self
+    
+    # ML function - Project the rows batch by batch
+    def transform(self, X) -> np.ndarray:
+        X = X.tocsr() if sp.issparse(X) else np.asarray(X)
+        batches = [self.model_.transform(self.__get_batch(X, start, end)) for start, end in self.__get_batches(X.shape[0])]
+        return np.vstack(batches) if len(batches) else np.empty((0, self.model_.n_components_))
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+    Created by: Andrés Segura-Tinoco
+    Version: 0.2.0
+    Created on: Oct 18, 2026
+    Updated on: Oct 18, 2026
+    Description: Budget-aware (anytime) hyperparameter search of the ML engine.
+"""
+
+# Import Custom libraries
+from ml.constant import SearchStrategy
+import ml.logging as mll
+
+# Import Python base libraries
+import math
+import time
+import numpy as np
+
+# Import ML libraries
+from sklearn.base import clone
+from sklearn.model_selection import ParameterGrid, ParameterSampler
+from sklearn.model_selection import cross_val_score, train_test_split
+
+# Budget-aware search class: grid, random or successive halving, stopped by a fit-count or wall-clock budget (keeps the best so far)
+class BudgetSearch:
+    
+    # Constructor
+    def __init__(self, estimator, param_space, strategy:str, scoring:str, cv:int, n_jobs:int=None, max_fits:int=0, max_time:float=0,
+                 factor:int=3, max_candidates:int=0, random_state:int=None, logger:mll.MLLog=None):
+        self.estimator = estimator
+        self.param_space = param_space
+        self.strategy = strategy
+        self.scoring = scoring
+        self.cv = cv
+        self.n_jobs = n_jobs
+        self.max_fits = max_fits
+        self.max_time = max_time
+        self.factor = factor
+        self.max_candidates = max_candidates
+        self.random_state = random_state
+        self.logger = logger
+        self.n_fits = 0
+        self.exhausted = False
+        self.cv_results_ = {"params": [], "mean_test_score": [], "std_test_score": [], "n_resources": [], "rung": []}
+    
+    # Return the search summary (saved with the scenario metrics)
+    def get_info(self) -> dict:
+        return {"strategy": self.strategy, "n_candidates": len(set([str(p) for p in self.cv_results_["params"]])),
+                "n_fits": self.n_fits, "exhausted": self.exhausted}
+    
+    # Util function - Return True if the next candidate evaluation (cv fits) exceeds the budget
+    def __is_over_budget(self) -> bool:
+        over_fits = self.max_fits > 0 and self.n_fits + self.cv > self.max_fits
+        over_time = self.max_time > 0 and time.time() - self.start_time > self.max_time
+        return over_fits or over_time
+    
+    # Util function - Return the list of candidates (random strategy and max_candidates use a seeded sample)
+    def __get_candidates(self) -> list:
+        candidates = list(ParameterGrid(self.param_space))
+        n_candidates = min(self.max_candidates, len(candidates)) if self.max_candidates > 0 else len(candidates)
+        
+        if self.strategy == SearchStrategy.RANDOM.value or n_candidates < len(candidates):
+            candidates = list(ParameterSampler(self.param_space, n_iter=n_candidates, random_state=self.random_state))
+        
+        return candidates
+    
+    # Util function - Return the ranking key of an evaluated candidate (failed candidates, with a NaN score, are ranked last)
+    def __get_rank_key(self, result:tuple) -> float:
+        return -np.inf if np.isnan(result[0]) else result[0]
+    
+    # Core function - Evaluate a candidate with cross-validation on (a subsample of) the data, an invalid candidate scores NaN
+    def __evaluate(self, params:dict, X, y, n_resources:int, rung:int) -> float:
+        clf = clone(self.estimator).set_params(**params)
+        
+        try:
+            scores = cross_val_score(clf, X, y, scoring=self.scoring, cv=self.cv, n_jobs=self.n_jobs, error_score=np.nan)
+        except Exception as e:
+            scores = np.full(self.cv, np.nan)
+            if self.logger is not None:
+                self.logger.log_error("- Search candidate failed: " + str(params) + " - " + str(e).strip().split("\n")[0])
+        self.n_fits += self.cv
+        
+        self.cv_results_["params"].append(params)
+        self.cv_results_["mean_test_score"].append(np.mean(scores))
+        self.cv_results_["std_test_score"].append(np.std(scores))
+        self.cv_results_["n_resources"].append(n_resources)
+        self.cv_results_["rung"].append(rung)
+        
+        return np.mean(scores)
+    
+    # Core function - Evaluate the candidates of a rung until the budget runs out (returns the evaluated ones with their scores)
+    def __run_rung(self, candidates:list, X, y, n_resources:int, rung:int) -> list:
+        results = []
+        
+        # Stratified subsample of the rung resources (number of training records)
+        if n_resources < X.shape[0]:
+            X, _, y, _ = train_test_split(X, y, train_size=n_resources, stratify=y, random_state=self.random_state)
+        
+        for params in candidates:
+            if self.__is_over_budget():
+                self.exhausted = True
+                break
+            results.append((self.__evaluate(params, X, y, n_resources, rung), params))
+        
+        if self.logger is not None:
+            self.logger.log_info("- Search rung %s: %s/%s candidates, %s records, %s fits" % (rung, len(results), len(candidates), n_resources, self.n_fits))
+        
+        return results
+    
+    # ML function - Search the best params and refit the best candidate with all the data
+    def fit(self, X, y):
+        self.start_time = time.time()
+        candidates = self.__get_candidates()
+        n_samples = X.shape[0]
+        best = []
+        
+        if self.strategy == SearchStrategy.HALVING.value:
+            
+            # Resources (records) grow by factor while the candidates shrink by factor
+            n_rungs = max(1, math.ceil(math.log(len(candidates), self.factor)))
+            n_classes = len(np.unique(y))
+            min_resources = min(n_samples, max(n_samples // self.factor ** (n_rungs - 1), 2 * self.cv * n_classes))
+            
+            for rung in range(n_rungs):
+                n_resources = n_samples if rung == n_rungs - 1 else min(min_resources * self.factor ** rung, n_samples)
+                results = self.__run_rung(candidates, X, y, n_resources, rung)
+                
+                # Anytime: the best candidates are the top ones of the highest evaluated rung
+                if len(results):
+                    best = sorted(results, key=self.__get_rank_key, reverse=True)
+                if self.exhausted or len(candidates) == 1:
+                    break
+                candidates = [params for score, params in best[:max(1, math.ceil(len(candidates) / self.factor))] if not np.isnan(score)]
+                if not len(candidates):
+                    break
+        else:
+            best = sorted(self.__run_rung(candidates, X, y, n_samples, 0), key=self.__get_rank_key, reverse=True)
+        
+        # Keep the best (the first candidate if the budget did not allow any evaluation, the estimator params if all the candidates failed)
+        if len(best) and not np.isnan(best[0][0]):
+            self.best_score_, self.best_params_ = best[0]
+        elif len(best):
+            self.best_score_, self.best_params_ = np.nan, {}
+            if self.logger is not None:
+                self.logger.log_error("- Search: all the evaluated candidates failed, the estimator params are kept")
+        else:
+            self.best_score_, self.best_params_ = np.nan, candidates[0]
+        self.best_estimator_ = clone(self.estimator).set_params(**self.best_params_)
+        self.best_estimator_.fit(X, y)
+        
+        return self
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""
+    Created by: Andrés Segura-Tinoco
+    Version: 0.2.0
+    Created on: Oct 18, 2026
+    Updated on: Oct 18, 2026
+    Description: Memoized Snowball stemmer of the ML engine.
+"""
+
+# Import Custom libraries
+from util import files as ufl
+import ml.logging as mll
+
+# Import Python base libraries
+import os
+import itertools
+from collections import OrderedDict
+
+# Import ML libraries
+from nltk.stem import SnowballStemmer
+
+# Shared stemmers (one per language and cache file)
+_stemmers = {}
+
+# Memoized stemmer class (bounded LRU cache of word stems, optionally persisted to disk)
+class CachedStemmer:
+    
+    # Constructor
+    def __init__(self, language:str, max_size:int=100000, filepath:str=""):
+        self.language = language
+        self.max_size = max_size
+        self.filepath = filepath
+        self.stemmer = SnowballStemmer(language)
+        self.stems = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.load()
+    
+    # Return the stem of a word (from cache if possible)
+    def stem(self, word:str) -> str:
+        stem = self.stems.get(word)
+        
+        if stem is not None:
+            self.hits += 1
+            self.stems.move_to_end(word)
+        else:
+            self.misses += 1
+            stem = self.stemmer.stem(word)
+            self.stems[word] = stem
+            
+            # Evict least recently used words
+            if len(self.stems) > self.max_size:
+                self.stems.popitem(last=False)
+                self.evictions += 1
+        
+        return stem
+    
+    # Return the cache updates since the given counters: counter deltas and the recently used stems (of a worker copy)
+    def get_updates(self, hits:int, misses:int) -> tuple:
+        n_hits = self.hits - hits
+        n_misses = self.misses - misses
+        n_used = min(n_hits + n_misses, len(self.stems))
+        stems = list(itertools.islice(reversed(self.stems.items()), n_used))[::-1]
+        return n_hits, n_misses, stems
+    
+    # Merge the cache updates of a stemmer copy (used words are moved to the end, like in stem)
+    def merge(self, updates:tuple):
+        n_hits, n_misses, stems = updates
+        self.hits += n_hits
+        self.misses += n_misses
+        
+        for word, stem in stems:
+            self.stems[word] = stem
+            self.stems.move_to_end(word)
+            
+            # Evict least recently used words
+            if len(self.stems) > self.max_size:
+                self.stems.popitem(last=False)
+                self.evictions += 1
+    
+    # Load cached stems from disk (if the file exists)
+    def load(self) -> bool:
+        result = False
+        
+        if self.filepath and os.path.exists(self.filepath):
+            stems = ufl.get_dict_from_json(self.filepath)
+            for word, stem in list(stems.items())[-self.max_size:]:
+                self.stems[word] = stem
+            result = True
+        
+        return result
+    
+    # Save cached stems to disk
+    def save(self) -> bool:
+        result = False
+        
+        if self.filepath:
+            result = ufl.save_dict_to_json(self.filepath, self.stems)
+        
+        return result
+    
+    # Log cache counters
+    def log_stats(self, logger:mll.MLLog):
+        total = self.hits + self.misses
+        hit_ratio = self.hits / total if total > 0 else 0.0
+        logger.log_info("- Stem cache: %s hits, %s misses (hit ratio: %0.4f), %s evictions, %s words" % (self.hits, self.misses, hit_ratio, self.evictions, len(self.stems)))
+
+# Return the shared stemmer of a language and cache file
+def get_stemmer(language:str, max_size:int=100000, filepath:str="") -> CachedStemmer:
+    key = (language, filepath)
+    
+    if key not in _stemmers:
+        _stemmers[key] = CachedStemmer(language, max_size, filepath)
+    
+    return _stemmers[key]
@@ -1,14 +1,15 @@
 # -*- coding: utf-8 -*-
 """
     Created by: Andrés Segura-Tinoco
-    Version: 0.12.0
+    Version: 0.13.0
     Created on: Oct 19, 2021
-    Updated on: Apr 06, 2023
+    Updated on: Oct 18, 2026
     Description: ML engine utility functions.
 """
 
 # Import Custom libraries
 from ml.constant import TaskType
+from ml.reducer import IncrementalReducer
 from util import ml as uml
 
 # Import Python base libraries
@@ -61,7 +62,7 @@ def value_to_features(values:list, prefix:str):
     return key_words
 
 # Util function - Apply dimensionality reduction
-def apply_dim_reduction(X:np.ndarray, method:str, n:float, y:np.ndarray=None) -> np.ndarray:
+def apply_dim_reduction(X:np.ndarray, method:str, n:float, y:np.ndarray=None, batch_size:int=1000, cache_folder:str="") -> np.ndarray:
     x_reduced = []
     variance = []
     method = method.upper()
@@ -76,6 +77,11 @@ def apply_dim_reduction(X:np.ndarray, method:str, n:float, y:np.ndarray=None) ->
         model = TruncatedSVD(n_components=n)
         x_reduced = model.fit_transform(X)
         variance = model.explained_variance_ratio_
+    
+    elif method == "IPCA":
+        model = IncrementalReducer(n_components=n, batch_size=batch_size, cache_folder=cache_folder)
+        x_reduced = model.fit_transform(X)
+        variance = model.explained_variance_ratio_
 
     elif method == "lda":
         model = LDA(n_components=n)
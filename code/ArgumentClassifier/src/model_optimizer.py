@@ -1,56 +1,99 @@
 # -*- coding: utf-8 -*-
 """
 Created on Mon Apr 24, 2023
-Updated on Wen Apr 26, 2023
+Updated on Sun Oct 18, 2026
 
 @author: Andrés Segura-Tinoco
 """
 
 # Import Custom libraries
 from util import files as ufl
+import ml.engine as mle
+import ml.logging as mll
+from ml.constant import ModelType
+from main import get_target_label
 
-# Import ML libraries
+# Import Python base libraries
 import time
+import multiprocessing as mp
 import numpy as np
+
+# Import ML libraries
 import optuna
 import lightgbm as lgb
 import sklearn.metrics
 from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import LabelEncoder
 
-def load_dataset():
-    filepath = "../../../data/dataset.csv"
-    label_column = "label"
-    dataset = ufl.get_df_from_csv(filepath)
+# LightGBM native param names and their LGBMClassifier names (used by MLEngine)
+PARAM_NAMES = {"min_data_in_leaf": "min_child_samples", "lambda_l1": "reg_alpha", "lambda_l2": "reg_lambda", "min_gain_to_split": "min_split_gain",
+               "feature_fraction": "colsample_bytree", "bagging_fraction": "subsample", "bagging_freq": "subsample_freq"}
+
+# Training and validation data (loaded once per process and shared by all its trials)
+data = {}
+
+def read_app_setup() -> dict:
+    filepath = "../config/config.json"
+    setup = ufl.get_dict_from_json(filepath)
+    return setup
+
+def load_dataset(app_setup:dict) -> dict:
+    task = app_setup["optimizer"]["task"]
+    train_setup = app_setup["train"]
+    model_state = train_setup["model_state"]
+    
+    # Read (cached) dataset, the optimizer workers split the available cores like scenario workers (one model at a time each)
+    logger = mll.MLLog()
+    parallel_setup = {**app_setup["parallel"], "scenario_workers": app_setup["optimizer"]["n_workers"], "outer_jobs": 1}
+    ml_ngx = mle.MLEngine(language=app_setup["language"], task_type=task, logger=logger, stem_setup=app_setup["stem_cache"], parallel_setup=parallel_setup)
+    dataset, label_dict = ml_ngx.create_dataset(app_setup["data_folder"], get_target_label(task), False, app_setup["features"], True)
+    
+    # Seeded splits: the test set of the main scenario is left out, the rest is split into train and validation sets
+    X_train, X_test, y_train, y_test = ml_ngx.split_dataset(dataset, train_setup)
+    X_fit, X_valid, y_fit, y_valid = train_test_split(X_train, y_train, test_size=train_setup["perc_test"], stratify=y_train, random_state=model_state)
     
-    # Features (X) and labels (y)
-    X = dataset.drop(label_column, axis=1).values
-    y_cat = dataset[label_column].values
+    # LightGBM datasets are binned only once (bin params are fixed, not tuned)
+    ds_params = {"max_bin": 255, "feature_pre_filter": False, "verbosity": -1}
+    dtrain = lgb.Dataset(X_fit, label=y_fit, params=ds_params).construct()
+    dvalid = lgb.Dataset(X_valid, label=y_valid, reference=dtrain, params=ds_params).construct()
     
-    # Encoding categorical data into numerical data
-    label_encoder = LabelEncoder()
-    y = label_encoder.fit_transform(y_cat)
+    # LightGBM threads of each worker (inner threads of its cores share, honoring the CPU affinity and the parallel section)
+    n_threads = ml_ngx.parallel_setup["inner_threads"]
     
-    return X, y
+    return {"dtrain": dtrain, "dvalid": dvalid, "X_valid": X_valid, "y_valid": y_valid, "n_classes": len(label_dict), "model_state": model_state, "n_threads": n_threads}
 
-def objective(trial):
-    data, target = load_dataset()
+def get_data() -> dict:
+    if not len(data):
+        data.update(load_dataset(read_app_setup()))
+    return data
+
+def get_pruning_callback(trial, metric:str):
     
-    X_train, X_test, y_train, y_test = train_test_split(data, target, test_size=0.2)
-    dtrain = lgb.Dataset(X_train, label=y_train)
+    # Reports the validation accuracy of each boosting round and stops hopeless trials
+    def callback(env):
+        for data_name, eval_name, value, _ in env.evaluation_result_list:
+            if data_name == "valid" and eval_name == metric:
+                trial.report(1.0 - value, step=env.iteration)
+                if trial.should_prune():
+                    raise optuna.TrialPruned()
+    
+    return callback
 
+def objective(trial):
+    data = get_data()
+    binary = data["n_classes"] == 2
+    metric = "binary_error" if binary else "multi_error"
+    
     param = {
-        "objective": "binary",
-        "metric": "binary_logloss",
+        "objective": "binary" if binary else "multiclass",
+        "metric": metric,
         "verbosity": -1,
         "boosting_type": "gbdt",
-        "seed": 42,
+        "seed": data["model_state"],
+        "num_threads": data["n_threads"],
         "learning_rate": trial.suggest_float("learning_rate", 1e-2, 1),
-        "n_estimators": trial.suggest_int("n_estimators", 150, 300),
         "num_leaves": trial.suggest_int("num_leaves", 20, 3000, step=20),
         "max_depth": trial.suggest_int("max_depth", 2, 10),
         "min_data_in_leaf": trial.suggest_int("min_data_in_leaf", 5, 50),
-        "max_bin": trial.suggest_int("max_bin", 100, 300),
         "lambda_l1": trial.suggest_float("lambda_l1", 1e-8, 10.0, log=True),
         "lambda_l2": trial.suggest_float("lambda_l2", 1e-8, 10.0, log=True),
         "min_gain_to_split": trial.suggest_float("min_gain_to_split", 0, 10),
@@ -58,29 +101,82 @@ def objective(trial):
         "bagging_fraction": trial.suggest_float("bagging_fraction", 0.4, 1.0),
         "bagging_freq": trial.suggest_int("bagging_freq", 1, 7),
     }
-
-    gbm = lgb.train(param, dtrain)
-    preds = gbm.predict(X_test)
-    y_pred = np.rint(preds)
-    accuracy = sklearn.metrics.accuracy_score(y_test, y_pred)
+    if not binary:
+        param["num_class"] = data["n_classes"]
+    n_estimators = trial.suggest_int("n_estimators", 150, 300)
+    
+    gbm = lgb.train(param, data["dtrain"], num_boost_round=n_estimators, valid_sets=[data["dvalid"]], valid_names=["valid"],
+                    callbacks=[get_pruning_callback(trial, metric)])
+    preds = gbm.predict(data["X_valid"])
+    y_pred = np.rint(preds) if binary else np.argmax(preds, axis=1)
+    accuracy = sklearn.metrics.accuracy_score(data["y_valid"], y_pred)
     
     return accuracy
 
+def create_study(opt_setup:dict, sampler_seed:int, load_if_exists:bool=True):
+    storage = "sqlite:///" + opt_setup["storage"]
+    study_name = "lightgbm-" + opt_setup["task"]
+    sampler = optuna.samplers.TPESampler(seed=sampler_seed)
+    pruner = optuna.pruners.MedianPruner(n_startup_trials=5, n_warmup_steps=20)
+    study = optuna.create_study(study_name=study_name, storage=storage, direction="maximize", sampler=sampler, pruner=pruner, load_if_exists=load_if_exists)
+    return study
+
+def run_worker(opt_setup:dict, sampler_seed:int, n_trials:int):
+    study = create_study(opt_setup, sampler_seed)
+    study.optimize(objective, n_trials=n_trials)
+
+def save_best_params(app_setup:dict, study) -> bool:
+    task = app_setup["optimizer"]["task"]
+    params = {PARAM_NAMES.get(k, k): v for k, v in study.best_params.items()}
+    params["random_state"] = app_setup["train"]["model_state"]
+    
+    # Written where MLEngine.__get_model_params reads the tuned params
+    ml_ngx = mle.MLEngine(language=app_setup["language"], task_type=task, logger=mll.MLLog())
+    result = ml_ngx.save_tuned_params(ModelType.GRADIENT_BOOSTING.value, params)
+    
+    return result
+
 if __name__ == "__main__":
     start_time = time.time()
-    study = optuna.create_study(direction="maximize")
-    study.optimize(objective, n_trials=200)
+    app_setup = read_app_setup()
+    opt_setup = app_setup["optimizer"]
+    model_state = app_setup["train"]["model_state"]
+    n_workers = max(1, opt_setup["n_workers"])
+    
+    # Dataset is loaded and binned once, before the workers are started (they inherit it)
+    get_data()
+    
+    # The study is stored in SQLite: a run can be resumed and its trials shared by the workers
+    study = create_study(opt_setup, model_state)
+    n_done = len([t for t in study.trials if t.state.is_finished()])
+    n_trials = max(0, opt_setup["n_trials"] - n_done)
+    print("Finished trials: {}, remaining trials: {}".format(n_done, n_trials))
+    
+    if n_trials > 0:
+        if n_workers > 1:
+            trials = [n_trials // n_workers + (1 if i < n_trials % n_workers else 0) for i in range(n_workers)]
+            workers = [mp.Process(target=run_worker, args=(opt_setup, model_state + i, n)) for i, n in enumerate(trials) if n > 0]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+        else:
+            study.optimize(objective, n_trials=n_trials)
+    
     elapsed_time = (time.time() - start_time)
-
+    study = create_study(opt_setup, model_state)
+    
     print("Number of finished trials: {}".format(len(study.trials)))
-
+    print("Number of pruned trials: {}".format(len([t for t in study.trials if t.state == optuna.trial.TrialState.PRUNED])))
+    
     print("Best trial:")
     trial = study.best_trial
-
+    
     print("  Value: {}".format(trial.value))
-
+    
     print("  Params: ")
     for key, value in trial.params.items():
         print("    {}: {}".format(key, value))
     
+    print("Best params saved:", save_best_params(app_setup, study))
     print("Elapsed time:", elapsed_time)
@@ -0,0 +1,293 @@
+# -*- coding: utf-8 -*-
+"""
+    Created by: Andrés Segura-Tinoco
+    Version: 0.3.0
+    Created on: Oct 18, 2026
+    Updated on: Oct 18, 2026
+    Description: Local HTTP scoring service (saved models kept in memory, requests grouped in micro-batches).
+"""
+
+# Import Custom libraries
+from util import files as ufl
+import ml.engine as mle
+import ml.logging as mll
+from ml.constant import TaskType
+
+# Import Python base libraries
+import os
+import re
+import json
+import time
+import queue
+import threading
+import numpy as np
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+######################
+### SERVER CLASSES ###
+######################
+
+# Scoring statistics class (latency percentiles and batch size histogram)
+class ScoringStats:
+    
+    # Constructor
+    def __init__(self, max_samples:int=10000):
+        self.lock = threading.Lock()
+        self.latencies = deque(maxlen=max_samples)
+        self.batch_sizes = {}
+        self.n_requests = 0
+        self.n_records = 0
+    
+    # Add the latency (in ms) of a request
+    def add_latency(self, latency:float):
+        with self.lock:
+            self.latencies.append(latency)
+            self.n_requests += 1
+    
+    # Add the size of a batch (histogram buckets are powers of 2)
+    def add_batch(self, batch_size:int):
+        bucket = 1 << max(batch_size - 1, 0).bit_length()
+        with self.lock:
+            self.batch_sizes[bucket] = self.batch_sizes.get(bucket, 0) + 1
+            self.n_records += batch_size
+    
+    # Return a summary of the statistics
+    def get_summary(self) -> dict:
+        with self.lock:
+            latencies = np.array(self.latencies)
+            summary = {"requests": self.n_requests, "records": self.n_records,
+                       "batch_size_histogram": {"<=" + str(k): v for k, v in sorted(self.batch_sizes.items())}}
+        
+        if len(latencies):
+            p50, p90, p95, p99 = np.percentile(latencies, [50, 90, 95, 99])
+            summary["latency_ms"] = {"p50": p50, "p90": p90, "p95": p95, "p99": p99, "max": latencies.max()}
+        
+        return summary
+
+# Micro-batcher class (one per task): concurrent requests are grouped before calling predict
+class MicroBatcher:
+    
+    # Constructor
+    def __init__(self, ml_ngx:mle.MLEngine, max_batch_size:int, max_wait_ms:float, stats:ScoringStats):
+        self.ml_ngx = ml_ngx
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.stats = stats
+        self.requests = queue.Queue()
+        self.worker = threading.Thread(target=self.__run, daemon=True)
+        self.worker.start()
+    
+    # Validate a request before it joins a micro-batch (ValueError if it is invalid)
+    def __validate(self, features:list, proba:bool):
+        if not isinstance(features, list) or not len(features) or not all([isinstance(v, dict) for v in features]):
+            raise ValueError("The features must be a non-empty list of feature records")
+        if proba and not hasattr(self.ml_ngx.model, "predict_proba"):
+            raise ValueError("The model of this task does not predict probabilities")
+    
+    # Enqueue a request and wait for its predictions
+    def predict(self, features:list, proba:bool=False) -> list:
+        self.__validate(features, proba)
+        request = {"features": features, "proba": proba, "done": threading.Event(), "result": None, "error": None}
+        self.requests.put(request)
+        request["done"].wait()
+        
+        if request["error"] is not None:
+            raise request["error"]
+        
+        return request["result"]
+    
+    # Collect the requests of the next micro-batch (up to max size or max wait)
+    def __get_batch(self) -> list:
+        batch = [self.requests.get()]
+        n_records = len(batch[0]["features"])
+        deadline = time.time() + self.max_wait
+        
+        while n_records < self.max_batch_size:
+            timeout = deadline - time.time()
+            if timeout <= 0:
+                break
+            try:
+                request = self.requests.get(timeout=timeout)
+            except queue.Empty:
+                break
+            batch.append(request)
+            n_records += len(request["features"])
+        
+        return batch
+    
+    # Predict the requests of a micro-batch: featurized once, then one predict call (and one predict_proba call if needed)
+    def __predict_batch(self, batch:list):
+        features = [v for request in batch for v in request["features"]]
+        X = self.ml_ngx.transform(features)
+        labels = self.ml_ngx.predict_matrix(X)
+        probas = self.ml_ngx.predict_matrix(X, proba=True) if any([r["proba"] for r in batch]) else None
+        self.stats.add_batch(len(features))
+        
+        start = 0
+        for request in batch:
+            end = start + len(request["features"])
+            result = {"labels": labels[start:end].tolist()}
+            if request["proba"]:
+                result["probabilities"] = probas[start:end].tolist()
+            request["result"] = result
+            start = end
+    
+    # Worker loop: if a micro-batch fails, its requests are predicted one by one (only the invalid ones fail)
+    def __run(self):
+        while True:
+            batch = self.__get_batch()
+            
+            try:
+                self.__predict_batch(batch)
+            
+            except Exception as e:
+                if len(batch) == 1:
+                    batch[0]["error"] = e
+                else:
+                    for request in batch:
+                        try:
+                            self.__predict_batch([request])
+                        except Exception as e:
+                            request["error"] = e
+            
+            for request in batch:
+                request["done"].set()
+
+# Threaded HTTP server class (the listen backlog is set from the server setup)
+class ScoringServer(ThreadingHTTPServer):
+    request_queue_size = 128
+
+# HTTP request handler class
+class ScoringHandler(BaseHTTPRequestHandler):
+    batchers = {}
+    stats = None
+    logger = None
+    
+    # Send a JSON response
+    def __send_json(self, status:int, data:dict):
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    # GET /health and /stats
+    def do_GET(self):
+        if self.path == "/health":
+            self.__send_json(200, {"status": "ok", "tasks": list(self.batchers.keys())})
+        elif self.path == "/stats":
+            self.__send_json(200, self.stats.get_summary())
+        else:
+            self.__send_json(404, {"error": "Not found"})
+    
+    # POST /predict/<task> with body {"features": [...], "proba": false}
+    def do_POST(self):
+        start_time = time.time()
+        match = re.fullmatch(r"/predict/([\w-]+)", self.path)
+        
+        if match is None or match.group(1) not in self.batchers:
+            self.__send_json(404, {"error": "Unknown task"})
+            return
+        
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length))
+            features = body["features"]
+            result = self.batchers[match.group(1)].predict(features, body.get("proba", False))
+            self.__send_json(200, result)
+            self.stats.add_latency((time.time() - start_time) * 1000)
+        
+        except (ValueError, KeyError, TypeError) as e:
+            self.__send_json(400, {"error": str(e)})
+        
+        except Exception as e:
+            self.logger.log_error("- Scoring error: " + str(e))
+            self.__send_json(500, {"error": str(e)})
+    
+    # Silence the default access log
+    def log_message(self, format, *args):
+        pass
+
+######################
+### CORE FUNCTIONS ###
+######################
+
+# Read data configuration
+def read_app_setup() -> dict:
+    filepath = "../config/config.json"
+    setup = ufl.get_dict_from_json(filepath)
+    return setup
+
+# Return the file path of the latest saved model of a task (highest model id)
+def get_latest_model_filepath(model_folder:str, task:str) -> str:
+    filepath = ""
+    max_id = 0
+    pattern = re.compile(r"model-(\d+)-" + re.escape(task) + r"-[\w-]+\.joblib")
+    
+    for file in os.listdir(model_folder):
+        match = pattern.fullmatch(file)
+        if match and not file.endswith("-featurizer.joblib") and int(match.group(1)) > max_id:
+            max_id = int(match.group(1))
+            filepath = model_folder + file
+    
+    return filepath
+
+# Load the models of the scoring tasks and create their micro-batchers
+def create_batchers(logger:mll.MLLog, app_setup:dict, stats:ScoringStats) -> dict:
+    batchers = {}
+    server_setup = app_setup["server"]
+    model_folder = app_setup["model_folder"]
+    tasks = [task.value for task in TaskType]
+    
+    for task in tasks:
+        model_file = server_setup["models"].get(task, "")
+        filepath = model_folder + model_file if model_file else get_latest_model_filepath(model_folder, task)
+        
+        if filepath:
+            ml_ngx = mle.MLEngine(language=app_setup["language"], task_type=task, logger=logger)
+            if ml_ngx.load_model(filepath):
+                batchers[task] = MicroBatcher(ml_ngx, server_setup["max_batch_size"], server_setup["max_wait_ms"], stats)
+                logger.log_info("- Serving %s with %s" % (task, filepath))
+    
+    return batchers
+
+# Start scoring server
+def start_server(logger:mll.MLLog, app_setup:dict):
+    server_setup = app_setup["server"]
+    stats = ScoringStats()
+    
+    ScoringHandler.batchers = create_batchers(logger, app_setup, stats)
+    ScoringHandler.stats = stats
+    ScoringHandler.logger = logger
+    ScoringServer.request_queue_size = server_setup["request_queue_size"]
+    
+    if len(ScoringHandler.batchers):
+        server = ScoringServer((server_setup["host"], server_setup["port"]), ScoringHandler)
+        logger.log_info(">> Listening on %s:%s" % (server_setup["host"], server_setup["port"]))
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        server.server_close()
+    else:
+        logger.log_error(">> ERROR - No saved models could be loaded.")
+
+#####################
+### START PROGRAM ###
+#####################
+if __name__ == "__main__":
+    logger = mll.MLLog(verbose=True)
+    logger.log_info("\n>> START SERVER")
+    app_setup = read_app_setup()
+    
+    if len(app_setup):
+        start_server(logger, app_setup)
+    else:
+        logger.log_error(">> ERROR - The application configuration could not be read.")
+    
+    logger.log_info(">> END SERVER")
+#####################
+#### END PROGRAM ####
+#####################
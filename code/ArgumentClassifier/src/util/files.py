@@ -1,14 +1,15 @@
 # -*- coding: utf-8 -*-
 """
     Created by: Andrés Segura-Tinoco
-    Version: 1.7.0
+    Version: 1.9.0
     Created on: Oct 06, 2021
-    Updated on: Mar 16, 2023
+    Updated on: Oct 18, 2026
     Description: Files library with utility functions
 """
 
 # Import Python base libraries
 import os
+import re
 import csv
 import json
 import yaml
@@ -129,6 +130,68 @@ def get_list_from_jsonl(json_path:str, encoding:str="utf-8") -> list:
         
     return result
 
+# Read the items of a JSON array file one at a time (incremental parsing, without loading the whole file)
+def get_items_from_json(json_path:str, encoding:str="utf-8", chunk_size:int=1048576):
+    decoder = json.JSONDecoder()
+    delimiter = re.compile(r"[,\]\s]")
+    
+    try:
+        with open(json_path, mode="r", encoding=encoding) as file:
+            buffer = file.read(chunk_size).lstrip()
+            eof = len(buffer) == 0
+            pos = 1 if buffer.startswith("[") else 0
+            
+            while True:
+                
+                # Skip whitespaces and separators (reading more data if needed)
+                while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                    pos += 1
+                
+                if pos == len(buffer) and not eof:
+                    chunk = file.read(chunk_size)
+                    eof = len(chunk) == 0
+                    buffer, pos = chunk, 0
+                    continue
+                
+                if pos == len(buffer) or buffer[pos] == "]":
+                    break
+                
+                # Bare tokens (numbers and literals) are only decoded whole once a delimiter follows them in the buffer
+                if not eof and buffer[pos] not in "{[\"" and not delimiter.search(buffer, pos):
+                    chunk = file.read(chunk_size)
+                    eof = len(chunk) == 0
+                    buffer, pos = buffer[pos:] + chunk, 0
+                    continue
+                
+                # Decode next item, or read more data if it is incomplete
+                try:
+                    item, pos = decoder.raw_decode(buffer, pos)
+                    
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    chunk = file.read(chunk_size)
+                    eof = len(chunk) == 0
+                    buffer, pos = buffer[pos:] + chunk, 0
+                    continue
+                
+                yield item
+        
+    except Exception as e:
+        print(e)
+
+# Read the items of a JSONL (json lines format) file one at a time
+def get_items_from_jsonl(json_path:str, encoding:str="utf-8"):
+    
+    try:
+        with open(json_path, mode="r", encoding=encoding) as file:
+            for jline in file:
+                if jline.strip():
+                    yield json.loads(jline)
+        
+    except Exception as e:
+        print(e)
+
 # Read a list from plain file
 def get_list_from_plain_file(file_path:str, encoding:str="utf-8") -> list:
     result = []
@@ -142,6 +205,19 @@ def get_list_from_plain_file(file_path:str, encoding:str="utf-8") -> list:
     
     return result
 
+# Get a light fingerprint of a file (size and last modification time)
+def get_file_fingerprint(file_path:str) -> str:
+    result = ""
+    
+    try:
+        stat = os.stat(file_path)
+        result = "%s-%s" % (stat.st_size, stat.st_mtime_ns)
+        
+    except Exception as e:
+        print(e)
+    
+    return result
+
 # Save or update a CSV data
 def save_csv_data(file_path:str, header:list, data:list, mode:str="w", encoding:str="utf-8") -> bool:
     df = pd.DataFrame(data, columns=header)
@@ -161,3 +237,17 @@ def save_df_to_csv(df:pd.DataFrame, file_path:str, index=False, mode:str="w", en
         print(e)
     
     return result
+
+# Save a dict (or list) to a JSON file
+def save_dict_to_json(json_path:str, data, encoding:str="utf-8") -> bool:
+    result = False
+    
+    try:
+        with open(json_path, mode="w", encoding=encoding) as file:
+            json.dump(data, file, ensure_ascii=False)
+        result = True
+        
+    except Exception as e:
+        print(e)
+    
+    return result
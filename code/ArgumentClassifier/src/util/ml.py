@@ -1,18 +1,15 @@
 # -*- coding: utf-8 -*-
 """
     Created by: Andrés Segura-Tinoco
-    Version: 0.3.0
+    Version: 0.5.0
     Created on: May 11, 2022
-    Updated on: Mar 20, 2023
+    Updated on: Oct 18, 2026
     Description: ML library with utility functions
 """
 
 # Import Python base libraries
 import pandas as pd
 
-# Import ML libraries
-from sklearn.feature_extraction.text import CountVectorizer
-
 # Util function - Convert the values of a dict of dicts to a list
 def convert_dict_dict_to_list(dict_dict:dict, key:str) -> list:
     values = []
@@ -39,15 +36,8 @@ def calc_df_sparsity(df:pd.DataFrame) -> float:
     sparsity = (df.to_numpy() == 0).mean()
     return sparsity
 
-# Util function - Creates a DataFrame from a sparse matrix using CountVectorizer data structure
-def create_df_from_sparse_matrix(matrix:list) -> pd.DataFrame:
-    
-    # Word vectorization
-    vectorizer = CountVectorizer(analyzer=lambda x: x)
-    data = vectorizer.fit_transform(matrix).toarray()
-    columns = vectorizer.get_feature_names_out()
-        
-    # Create dataframe
-    df = pd.DataFrame(data, columns=columns)
-    
-    return df
+# Util function - Calculate sparse matrix sparsity
+def calc_sparse_sparsity(matrix) -> float:
+    n_cells = matrix.shape[0] * matrix.shape[1]
+    sparsity = 1.0 - (matrix.count_nonzero() / n_cells) if n_cells > 0 else 0.0
+    return sparsity